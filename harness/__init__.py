@@ -0,0 +1,4 @@
+"""
+ReflectivAI worker test harness
+Shared execution engine and live metrics for the Python deployment tests
+"""
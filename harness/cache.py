@@ -0,0 +1,157 @@
+"""
+Incremental test selection
+Fingerprints the worker inputs and each scenario payload so unchanged,
+recently passing scenarios can reuse their cached result
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_VERSION = 1
+
+# Repo files that change worker behaviour, and the modes each one affects
+# (None = every mode). Anything not listed (widget.js, CSS, docs) never
+# invalidates a cached result.
+INPUT_DEPENDENCIES = {
+    "worker.js": None,
+    "config.json": None,
+    "citations.json": ["sales-coach", "product-knowledge"]
+}
+
+
+# hash_file result for an absent input
+MISSING = "missing"
+
+
+def hash_file(path: str) -> str:
+    """sha256 of a file's bytes, or MISSING"""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return MISSING
+
+
+def hash_inputs(root: str) -> Dict[str, str]:
+    """Fingerprint every tracked input file under root"""
+    return {name: hash_file(os.path.join(root, name)) for name in INPUT_DEPENDENCIES}
+
+
+def missing_inputs(input_hashes: Dict[str, str]) -> List[str]:
+    """Tracked inputs that were not found; fingerprints cannot see their edits"""
+    return [name for name, digest in sorted(input_hashes.items()) if digest == MISSING]
+
+
+def resolve_repo_root(default: str) -> str:
+    """
+    Checkout holding worker.js: the package's parent for a source or
+    editable install, else the working directory (a plain pip install
+    puts harness/ in site-packages)
+    """
+    if os.path.isfile(os.path.join(default, "worker.js")):
+        return default
+    return os.getcwd()
+
+
+@lru_cache(maxsize=None)
+def check_source(check: Any) -> str:
+    """
+    sha256 of the source of the module defining a check, plus harness.config
+    (CANONICAL_METRICS), so editing a check or a helper it calls changes
+    every fingerprint that uses it
+    """
+    from harness import config
+
+    digest = hashlib.sha256()
+    for module in (inspect.getmodule(check), config):
+        try:
+            digest.update(inspect.getsource(module).encode("utf-8"))
+        except (OSError, TypeError):
+            digest.update(getattr(check, "__qualname__", repr(check)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def scenario_fingerprint(scenario: Dict[str, Any], input_hashes: Dict[str, str],
+                         extra: str = "") -> str:
+    """Hash of the payload, its check and the inputs its mode depends on"""
+    mode = scenario["payload"].get("mode", "")
+    relevant = {
+        name: digest for name, digest in sorted(input_hashes.items())
+        if INPUT_DEPENDENCIES.get(name) is None or mode in INPUT_DEPENDENCIES[name]
+    }
+    material = json.dumps({
+        "payload": scenario["payload"],
+        "check": getattr(scenario["check"], "__name__", str(scenario["check"])),
+        "check_source": check_source(scenario["check"]),
+        "inputs": relevant,
+        "extra": extra
+    }, sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Per-scenario results persisted between runs"""
+
+    def __init__(self, path: str, ttl_seconds: float):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f, indent=2)
+
+    def lookup(self, name: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Cached passing result for an unchanged scenario within the TTL"""
+        entry = self.entries.get(name)
+        if not entry or entry["fingerprint"] != fingerprint or not entry["passed"]:
+            return None
+        if time.time() - entry["timestamp"] > self.ttl_seconds:
+            return None
+        return entry
+
+    def previously_failed(self, name: str) -> bool:
+        entry = self.entries.get(name)
+        return bool(entry) and not entry["passed"]
+
+    def record(self, name: str, fingerprint: str, outcome: Dict[str, Any]):
+        self.entries[name] = {
+            "fingerprint": fingerprint,
+            "timestamp": time.time(),
+            "passed": outcome["passed"],
+            "details": outcome["details"],
+            "excerpt": outcome["excerpt"],
+            "failed_checks": outcome["failed_checks"]
+        }
+
+    def plan(self, scenarios: List[Dict[str, Any]],
+             fingerprints: Dict[str, str]) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], Dict[str, Any]]]]:
+        """
+        Split scenarios into (to_run, reused)
+        to_run lists previously failing scenarios first, then the rest in order
+        """
+        to_run, reused = [], []
+        for scenario in scenarios:
+            entry = self.lookup(scenario["name"], fingerprints[scenario["name"]])
+            if entry:
+                reused.append((scenario, entry))
+            else:
+                to_run.append(scenario)
+        # sorted() is stable, so original order is kept within each group
+        to_run = sorted(to_run, key=lambda s: not self.previously_failed(s["name"]))
+        return to_run, reused
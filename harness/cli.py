@@ -0,0 +1,285 @@
+"""
+reflectiv-harness command line
+Only argparse and the scenario catalogue load up front so --help and
+--list stay fast; requests and the engine load when a run starts
+"""
+
+import argparse
+import os
+import sys
+from typing import List
+
+from harness.config import CACHE_FILE, REPO_ROOT, TIMEOUT, WORKER_URL
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line options"""
+    parser = argparse.ArgumentParser(
+        prog="reflectiv-harness",
+        description="ReflectivAI worker test harness (deployment + EI scoring suites)"
+    )
+    parser.add_argument("--url", default=WORKER_URL,
+                        help="Worker base URL (default: %(default)s)")
+    parser.add_argument("--suite", choices=["all", "deployment", "ei-scoring"], default="all",
+                        help="Suite to run (default: all)")
+    parser.add_argument("-k", dest="keyword", default="", metavar="EXPRESSION",
+                        help="Only run scenarios matching the expression, e.g. "
+                             "'sales-coach and (hiv or oncology)'; terms match name, "
+                             "suite, category, mode, disease and persona")
+    parser.add_argument("--list", action="store_true",
+                        help="List the selected scenarios and exit")
+    parser.add_argument("--format", default="text",
+                        help="Output format: text, json, junit or module:Class (default: text)")
+    parser.add_argument("--output", default=None,
+                        help="File for the formatter's results document (text: results JSON, default "
+                             "COMPREHENSIVE_DEPLOYMENT_TEST_RESULTS.json only when the whole deployment "
+                             "suite ran, else SELECTED_TEST_RESULTS.json; json/junit: default stdout)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Concurrent /chat requests per category (default: 1)")
+    parser.add_argument("--dashboard", action="store_true",
+                        help="Show a live dashboard (in-flight, RPS, latency percentiles, errors)")
+
+    sampling = parser.add_argument_group("sequential sampling",
+                                         "Re-run each scenario until its pass rate and p95 are settled")
+    sampling.add_argument("--adaptive", action="store_true",
+                          help="Enable sequential sampling instead of one shot per scenario")
+    sampling.add_argument("--confidence", type=float, default=0.9,
+                          help="One-sided confidence for the stopping bounds (default: 0.9)")
+    sampling.add_argument("--target-pass-rate", type=float, default=0.8,
+                          help="Required contract pass rate per scenario (default: 0.8)")
+    sampling.add_argument("--latency-budget", type=float, default=TIMEOUT * 1000,
+                          help="p95 latency budget in ms (default: %(default)s)")
+    sampling.add_argument("--min-samples", type=int, default=3,
+                          help="Samples taken before stopping is considered (default: 3)")
+    sampling.add_argument("--max-samples", type=int, default=30,
+                          help="Hard cap on samples per scenario (default: 30)")
+
+    incremental = parser.add_argument_group("incremental mode",
+                                            "Reuse results for scenarios whose inputs are unchanged")
+    incremental.add_argument("--incremental", action="store_true",
+                             help="Skip unchanged, recently passing scenarios; run failures first")
+    incremental.add_argument("--cache-ttl", type=float, default=24,
+                             help="Hours a cached pass stays valid (default: 24)")
+    incremental.add_argument("--cache-file", default=None,
+                             help=f"Result cache location (default: <repo root>/{CACHE_FILE})")
+    incremental.add_argument("--repo-root", default=None,
+                             help="Checkout whose worker.js/config.json/citations.json are fingerprinted "
+                                  "(default: this checkout, else the working directory)")
+
+    daemon = parser.add_argument_group("monitoring daemon",
+                                       "Run a rotating slice of the selection forever and serve /metrics")
+    daemon.add_argument("--daemon", action="store_true",
+                        help="Continuous synthetic monitoring with an OpenMetrics endpoint")
+    daemon.add_argument("--interval", type=float, default=60,
+                        help="Seconds between monitoring cycles (default: 60)")
+    daemon.add_argument("--slice", type=int, default=2,
+                        help="Scenarios run per cycle, rotating through the selection (default: 2)")
+    daemon.add_argument("--metrics-host", default="127.0.0.1",
+                        help="Bind address for /metrics (default: 127.0.0.1)")
+    daemon.add_argument("--metrics-port", type=int, default=9464,
+                        help="Port for /metrics (default: 9464)")
+    daemon.add_argument("--retention", type=float, default=3600,
+                        help="Seconds of history behind rolling pass ratio and quantiles (default: 3600)")
+
+    profiling = parser.add_argument_group("self-profiling",
+                                          "Measure the harness's own CPU and allocations per phase")
+    profiling.add_argument("--profile", action="store_true",
+                           help="Report client overhead per request and flag client saturation")
+    profiling.add_argument("--profile-out", default=None, metavar="FILE",
+                           help="Also run cProfile and write merged pstats to FILE (implies --profile)")
+    profiling.add_argument("--profile-alloc", action="store_true",
+                           help="Also trace allocations per phase with tracemalloc (implies --profile; "
+                                "inflates the CPU figures, so compare CPU from a run without it)")
+
+    contention = parser.add_argument_group("contention benchmark",
+                                           "Concurrent requests on one session vs isolated sessions")
+    contention.add_argument("--contention", action="store_true",
+                            help="Benchmark the first selected scenario under same-session concurrency")
+    contention.add_argument("--burst", type=int, default=5,
+                            help="Concurrent requests per burst (default: 5)")
+    contention.add_argument("--rounds", type=int, default=3,
+                            help="Isolated/shared burst pairs (default: 3)")
+    contention.add_argument("--stagger", type=float, default=50,
+                            help="Milliseconds between request starts within a burst (default: 50)")
+    contention.add_argument("--cooldown", type=float, default=60,
+                            help="Seconds between bursts, to clear the worker's per-IP rate window (default: 60)")
+
+    compression = parser.add_argument_group("compression benchmark",
+                                            "Wire size, decode CPU and latency by Accept-Encoding / body encoding")
+    compression.add_argument("--compression", action="store_true",
+                             help="Benchmark the selected scenarios under identity, gzip, br and gzip request bodies")
+    compression.add_argument("--repeat", type=int, default=3,
+                             help="Requests per scenario and encoding (default: 3)")
+    compression.add_argument("--pace", type=float, default=6,
+                             help="Seconds between requests, to stay under the per-IP limit (default: 6)")
+    compression.add_argument("--history-turns", type=int, default=0,
+                             help="Filler turns added to each payload's history (default: 0)")
+    return parser
+
+
+def list_scenarios(scenarios, run_health: bool):
+    """Print one line per selected test"""
+    from harness.scenarios import HEALTH_CHECK
+
+    entries = ([HEALTH_CHECK] if run_health else []) + scenarios
+    for s in entries:
+        payload = s["payload"]
+        tags = "/".join(str(payload[k]) for k in ("mode", "disease", "persona") if payload.get(k))
+        print(f"{s['suite']:<11} {s['name']:<48} [{tags}]")
+    print(f"\n{len(entries)} selected")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    from harness.scenarios import HEALTH_CHECK, SUITES, build_scenarios
+    from harness.selection import select
+
+    suites = SUITES if args.suite == "all" else [args.suite]
+    catalogue = build_scenarios()
+    try:
+        scenarios = select(catalogue, args.keyword, suites)
+        run_health = bool(select([HEALTH_CHECK], args.keyword, suites))
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.list:
+        list_scenarios(scenarios, run_health)
+        return 0
+    if not scenarios and not run_health:
+        print("No scenarios match the selection", file=sys.stderr)
+        return 1
+
+    if args.daemon:
+        from harness.monitor import run_daemon
+
+        return run_daemon(
+            scenarios, args.url, TIMEOUT,
+            interval=args.interval,
+            slice_size=args.slice,
+            host=args.metrics_host,
+            port=args.metrics_port,
+            retention_seconds=args.retention
+        )
+
+    if args.contention:
+        from harness.contention import print_report, run_contention_benchmark
+
+        if not scenarios:
+            print("No /chat scenario matches the selection", file=sys.stderr)
+            return 1
+        report = run_contention_benchmark(
+            scenarios[0], args.url, TIMEOUT,
+            burst=args.burst,
+            rounds=args.rounds,
+            stagger_ms=args.stagger,
+            cooldown=args.cooldown
+        )
+        print_report(report, args.output)
+        return 0 if report["isolated"]["ok"] or report["shared"]["ok"] else 1
+
+    if args.compression:
+        from harness.compression import print_report, run_compression_benchmark
+
+        if not scenarios:
+            print("No /chat scenario matches the selection", file=sys.stderr)
+            return 1
+        report = run_compression_benchmark(
+            scenarios, args.url, TIMEOUT,
+            repeat=args.repeat,
+            pace=args.pace,
+            history_turns=args.history_turns
+        )
+        print_report(report, args.output)
+        return 0 if report["encodings"]["identity"]["ok"] else 1
+
+    # Heavy imports only once we know a run is happening
+    from harness.dashboard import LiveDashboard
+    from harness.output import YELLOW, RESET, get_formatter
+    from harness.runner import Run, fetch_worker_version
+
+    try:
+        formatter = get_formatter(args.format)(output=args.output)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(f"--format: {e}")
+
+    run = Run(formatter, args.url, TIMEOUT)
+    # Only a run covering the whole deployment suite may claim readiness
+    deployment_total = sum(1 for s in catalogue if s["suite"] == "deployment") + 1
+    deployment_run = sum(1 for s in scenarios if s["suite"] == "deployment") + int(run_health)
+    run.results["deployment_coverage"] = {"selected": deployment_run, "total": deployment_total}
+    formatter.header(run.results)
+
+    sampler = None
+    if args.adaptive:
+        from harness.sampling import SequentialSampler
+
+        sampler = SequentialSampler(
+            confidence=args.confidence,
+            target_pass_rate=args.target_pass_rate,
+            latency_budget_ms=args.latency_budget,
+            min_samples=args.min_samples,
+            max_samples=args.max_samples
+        )
+        run.results["sampling"] = {
+            "confidence": sampler.confidence,
+            "target_pass_rate": sampler.target_pass_rate,
+            "latency_budget_ms": sampler.latency_budget_ms,
+            "min_samples": sampler.min_samples,
+            "max_samples": sampler.max_samples
+        }
+
+    cache = None
+    fingerprints = None
+    if args.incremental:
+        from harness.cache import (ResultCache, hash_inputs, missing_inputs,
+                                   resolve_repo_root, scenario_fingerprint)
+
+        repo_root = args.repo_root or resolve_repo_root(REPO_ROOT)
+        input_hashes = hash_inputs(repo_root)
+        missing = missing_inputs(input_hashes)
+        if missing:
+            # A fingerprint over a missing file never changes, so a cached
+            # pass would survive any edit to it
+            print(f"{YELLOW}--incremental: {', '.join(missing)} not found under {repo_root}; "
+                  f"running everything without the cache (see --repo-root){RESET}")
+        else:
+            cache = ResultCache(args.cache_file or os.path.join(repo_root, CACHE_FILE), args.cache_ttl * 3600)
+            extra = f"{args.url}|{fetch_worker_version(args.url)}|{'adaptive' if sampler else 'single'}"
+            fingerprints = {s["name"]: scenario_fingerprint(s, input_hashes, extra) for s in scenarios}
+
+    profiler = None
+    if args.profile or args.profile_out or args.profile_alloc:
+        from harness.profiling import PROFILER as profiler
+
+        profiler.start(cprofile=bool(args.profile_out), allocations=args.profile_alloc)
+
+    dashboard = None
+    if args.dashboard:
+        if LiveDashboard.supported():
+            dashboard = LiveDashboard()
+            dashboard.start()
+            formatter.write = dashboard.write
+        else:
+            print(f"{YELLOW}--dashboard needs an interactive terminal; continuing without it{RESET}")
+
+    try:
+        if run_health:
+            run.test_worker_health()
+        run.run_chat_categories(scenarios, args.workers, sampler, cache, fingerprints)
+    finally:
+        if dashboard is not None:
+            dashboard.stop()
+            formatter.write = print
+        if cache is not None:
+            cache.save()
+
+    if profiler is not None:
+        run.results["profile"] = profiler.report()
+        if args.profile_out:
+            profiler.dump(args.profile_out)
+        profiler.stop()
+
+    formatter.finish(run.results)
+    return 0 if run.pass_rate == 100 else 1
@@ -0,0 +1,237 @@
+"""
+Compression and payload-encoding benchmark
+Sends each selected /chat payload under several encodings and compares
+wire size, client decode CPU and end-to-end latency per encoding
+
+Response compression comes from the Cloudflare edge when Accept-Encoding
+asks for it (the worker itself always returns plain JSON). Compressed
+request bodies go straight to readJson in the worker, so the "gzip-body"
+encoding also shows whether the worker accepts them at all.
+"""
+
+import gzip
+import json
+import time
+import zlib
+from typing import Any, Dict, List
+
+import requests
+import urllib3
+
+from harness.engine import fresh_session
+from harness.metrics import percentile
+from harness.output import BLUE, GREEN, RED, RESET, YELLOW
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Downlink used for the transfer-time estimate (slow 3G-class mobile)
+SLOW_LINK_KBPS = 400
+
+# Filler turns for --history-turns, sized like real coach exchanges
+FILLER_TURNS = [
+    {"role": "user", "content": "The HCP says most of their patients are already stable on current "
+                                "therapy and they do not see a reason to switch. How should I respond?"},
+    {"role": "assistant", "content": "Acknowledge the stability first, then ask which patients still "
+                                     "miss visits or struggle with adherence. Anchor the conversation to "
+                                     "one eligible patient profile, cite the label-consistent data, and "
+                                     "close with a single discovery question about who they would "
+                                     "consider first. Avoid comparative claims you cannot support."}
+]
+
+
+def encodings() -> Dict[str, Dict[str, Any]]:
+    """Request/response encoding variants; br only when a brotli decoder is installed"""
+    variants = {
+        "identity": {"accept": "identity", "compress_body": False},
+        "gzip": {"accept": "gzip", "compress_body": False},
+        "gzip-body": {"accept": "gzip", "compress_body": True}
+    }
+    if brotli is not None:
+        variants["br"] = {"accept": "br", "compress_body": False}
+    return variants
+
+
+def pad_history(payload: Dict[str, Any], turns: int) -> Dict[str, Any]:
+    """Prepend `turns` filler messages to the payload's history/conversation"""
+    payload = dict(payload)
+    for key in ("history", "conversation"):
+        if key in payload:
+            filler = [FILLER_TURNS[i % 2] for i in range(turns)]
+            payload[key] = filler + list(payload[key])
+    return payload
+
+
+def decode_body(raw: bytes, content_encoding: str) -> bytes:
+    """Undo the response Content-Encoding"""
+    if content_encoding == "gzip":
+        return gzip.decompress(raw)
+    if content_encoding == "deflate":
+        return zlib.decompress(raw)
+    if content_encoding == "br":
+        return brotli.decompress(raw)
+    return raw
+
+
+def measure(url: str, payload: Dict[str, Any], variant: Dict[str, Any],
+            timeout: float) -> Dict[str, Any]:
+    """One request: bytes on the wire each way, elapsed, and decode CPU"""
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json", "Accept-Encoding": variant["accept"]}
+    if variant["compress_body"]:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+
+    sample = {"request_bytes": len(body), "status": None, "error": None}
+    start_time = time.time()
+    try:
+        resp = requests.post(f"{url}/chat", data=body, headers=headers, timeout=timeout, stream=True)
+        # Raw bytes as received, before requests/urllib3 decode anything
+        raw = resp.raw.read(decode_content=False)
+        sample["elapsed"] = int((time.time() - start_time) * 1000)
+        resp.close()
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        # Reading resp.raw directly bypasses requests' wrapping, so body read
+        # timeouts and resets arrive as urllib3 ReadTimeoutError/ProtocolError
+        sample["elapsed"] = int((time.time() - start_time) * 1000)
+        sample["error"] = type(e).__name__
+        return sample
+
+    served = resp.headers.get("Content-Encoding", "identity").lower()
+    sample.update(status=resp.status_code, served=served, response_bytes=len(raw))
+
+    cpu_start = time.thread_time()
+    try:
+        decoded = decode_body(raw, served)
+        data = json.loads(decoded)
+    except (OSError, ValueError, zlib.error) as e:
+        sample["error"] = f"decode: {e}"
+        return sample
+    finally:
+        sample["decode_ms"] = round((time.thread_time() - cpu_start) * 1000, 3)
+
+    sample["decoded_bytes"] = len(decoded)
+    sample["data"] = data
+    return sample
+
+
+def summarize(samples: List[Dict[str, Any]], baseline: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Medians per encoding; latency deltas against the identity baseline"""
+    ok = [s for s in samples if s["status"] == 200 and not s["error"]]
+    latencies = [s["elapsed"] for s in ok]
+
+    def median(key):
+        return percentile([s[key] for s in ok], 50)
+
+    summary = {
+        "requests": len(samples),
+        "ok": len(ok),
+        "passed": sum(1 for s in ok if s.get("passed")),
+        "statuses": {},
+        "served": {},
+        "request_bytes": percentile([s["request_bytes"] for s in samples], 50),
+        "response_bytes": median("response_bytes"),
+        "decoded_bytes": median("decoded_bytes"),
+        "decode_ms": median("decode_ms"),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95)
+    }
+    for s in samples:
+        key = str(s["status"] or s["error"])
+        summary["statuses"][key] = summary["statuses"].get(key, 0) + 1
+        if s.get("served"):
+            summary["served"][s["served"]] = summary["served"].get(s["served"], 0) + 1
+
+    if summary["response_bytes"] is not None:
+        wire_bits = (summary["request_bytes"] + summary["response_bytes"]) * 8
+        summary["slow_link_ms"] = round(wire_bits / SLOW_LINK_KBPS)
+        if summary["decoded_bytes"]:
+            summary["ratio"] = round(summary["response_bytes"] / summary["decoded_bytes"], 3)
+    if baseline and baseline["p50_ms"] is not None and summary["p50_ms"] is not None:
+        summary["p50_delta_ms"] = summary["p50_ms"] - baseline["p50_ms"]
+    return summary
+
+
+def run_compression_benchmark(scenarios: List[Dict[str, Any]], url: str, timeout: float,
+                              repeat: int = 3, pace: float = 6, history_turns: int = 0) -> Dict[str, Any]:
+    """
+    Round-robin every encoding over every scenario `repeat` times
+    Interleaving keeps worker/provider drift from favouring one encoding;
+    `pace` seconds between requests stays under the per-IP /chat limit
+    """
+    variants = encodings()
+    samples: Dict[str, List[Dict[str, Any]]] = {name: [] for name in variants}
+    first = True
+
+    for n in range(repeat):
+        for scenario in scenarios:
+            for name, variant in variants.items():
+                if not first:
+                    time.sleep(pace)
+                first = False
+
+                payload = fresh_session(pad_history(scenario["payload"], history_turns), f"enc-{name}-{n}")
+                sample = measure(url, payload, variant, timeout)
+                if "data" in sample:
+                    data = sample.pop("data")
+                    try:
+                        checks, _, _ = scenario["check"](data, sample["elapsed"])
+                        sample["passed"] = all(ok for _, ok in checks)
+                    except Exception:
+                        sample["passed"] = False
+                samples[name].append(sample)
+
+    baseline = summarize(samples["identity"])
+    return {
+        "worker_url": url,
+        "scenarios": [s["name"] for s in scenarios],
+        "repeat": repeat,
+        "history_turns": history_turns,
+        "slow_link_kbps": SLOW_LINK_KBPS,
+        "brotli": brotli is not None,
+        "encodings": {
+            name: baseline if name == "identity" else summarize(items, baseline)
+            for name, items in samples.items()
+        }
+    }
+
+
+def print_report(report: Dict[str, Any], output: str = None):
+    """One row per encoding; full report as JSON to `output` if given"""
+    print(f"\n{BLUE}{'='*60}{RESET}")
+    print(f"{BLUE}COMPRESSION / PAYLOAD-ENCODING BENCHMARK{RESET}")
+    print(f"{BLUE}{'='*60}{RESET}\n")
+    print(f"Scenarios: {len(report['scenarios'])} x {report['repeat']} per encoding, "
+          f"{report['history_turns']} extra history turns\n")
+
+    def cell(value):
+        return "-" if value is None else str(value)
+
+    print(f"{'encoding':<11}{'ok':>6}{'req B':>8}{'resp B':>8}{'ratio':>7}{'decode ms':>11}"
+          f"{'p50 ms':>8}{'p95 ms':>8}{'Δp50':>7}{f'@{SLOW_LINK_KBPS}k ms':>11}")
+    for name, s in report["encodings"].items():
+        ok = f"{s['ok']}/{s['requests']}"
+        print(f"{name:<11}{ok:>6}{cell(s['request_bytes']):>8}{cell(s['response_bytes']):>8}"
+              f"{cell(s.get('ratio')):>7}{cell(s['decode_ms']):>11}{cell(s['p50_ms']):>8}"
+              f"{cell(s['p95_ms']):>8}{cell(s.get('p50_delta_ms', 0)):>7}{cell(s.get('slow_link_ms')):>11}")
+
+    print()
+    for name, s in report["encodings"].items():
+        asked = encodings()[name]["accept"]
+        if s["ok"] and asked != "identity" and asked not in s["served"]:
+            print(f"{YELLOW}{name}:{RESET} asked for {asked}, served {', '.join(s['served'])}")
+        if s["ok"] < s["requests"]:
+            print(f"{RED}{name}:{RESET} statuses {s['statuses']}")
+        elif s["passed"] < s["ok"]:
+            print(f"{YELLOW}{name}:{RESET} {s['ok'] - s['passed']} responses failed their checks")
+    if not report["brotli"]:
+        print(f"{YELLOW}br skipped:{RESET} install brotli to benchmark Accept-Encoding: br")
+    if all(s["ok"] == s["requests"] for s in report["encodings"].values()):
+        print(f"{GREEN}Every encoding was accepted{RESET}")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n{BLUE}Full report saved to:{RESET} {output}")
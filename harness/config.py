@@ -0,0 +1,29 @@
+"""
+Shared harness configuration
+Kept import-light: the CLI reads it before deciding what else to load
+"""
+
+import os
+
+WORKER_URL = "https://my-chat-agent-v2.tonyabdelmalak.workers.dev"
+TIMEOUT = 30
+
+# Checkout root (harness/ lives directly under it)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Incremental-mode result cache, relative to the fingerprinted checkout
+CACHE_FILE = ".harness_cache.json"
+
+# Expected 10 metrics (NO "accuracy" or "ei" nesting)
+CANONICAL_METRICS = [
+    "empathy",
+    "clarity",
+    "compliance",
+    "discovery",
+    "objection_handling",
+    "confidence",
+    "active_listening",
+    "adaptability",
+    "action_insight",
+    "resilience"
+]
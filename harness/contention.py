@@ -0,0 +1,203 @@
+"""
+Same-session contention benchmark
+Fires bursts of identical /chat requests that share one session (and, from
+this machine, one client IP) and compares them with equal bursts spread
+over isolated sessions
+
+The worker keeps per-session state with an unlocked seqGet -> seqPut
+read-modify-write (state.lastNorm drives the repeated-reply loop guard)
+and a per-IP rateLimit Map. Under serial execution a repeated reply in the
+same session is rewritten by the loop guard, so identical replies that
+slip through a shared-session burst are reads of stale state: lost updates.
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, List
+
+from harness.engine import post_chat
+from harness.metrics import percentile
+from harness.output import BLUE, RESET, YELLOW
+
+# Openings of the worker's loop-guard replacement replies (worker.js, postChat)
+LOOP_GUARD_REPLIES = [
+    "in my clinic, we review history, adherence, and recent exposures",
+    "anchor to eligibility, one safety check"
+]
+
+
+def normalize(text: str) -> str:
+    """Same normalisation the worker applies before comparing replies"""
+    return re.sub(r"\s+", " ", str(text or "").lower()).strip()
+
+
+def fire_burst(url: str, timeout: float, payloads: List[Dict[str, Any]],
+               stagger_ms: float) -> List[Dict[str, Any]]:
+    """Send payloads concurrently, request i starting i * stagger_ms after a shared barrier"""
+    barrier = threading.Barrier(len(payloads))
+    records: List[Dict[str, Any]] = [None] * len(payloads)
+
+    def send(index: int, payload: Dict[str, Any]):
+        barrier.wait()
+        time.sleep(index * stagger_ms / 1000.0)
+        result = post_chat(url, payload, timeout)
+        data = result["data"] if isinstance(result["data"], dict) else {}
+        records[index] = {
+            "index": index,
+            "finished": time.monotonic(),
+            "elapsed": result["elapsed"],
+            "status": result["status"],
+            "error": result["error"],
+            "reply": normalize(data.get("reply", "")) if result["status"] == 200 else ""
+        }
+
+    threads = [threading.Thread(target=send, args=(i, p)) for i, p in enumerate(payloads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return records
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Latency, error, loop-guard and ordering figures for one phase"""
+    latencies = [r["elapsed"] for r in records if r["status"] == 200]
+    statuses = Counter(str(r["status"] or r["error"]) for r in records)
+
+    guard_rewrites = 0
+    duplicates = 0
+    seen = set()
+    for r in sorted(records, key=lambda r: r["finished"]):
+        if not r["reply"]:
+            continue
+        if any(r["reply"].startswith(g) for g in LOOP_GUARD_REPLIES):
+            guard_rewrites += 1
+        elif r["reply"] in seen:
+            duplicates += 1
+        seen.add(r["reply"])
+
+    # Pairs submitted in one order but answered in the other
+    by_finish = [r["index"] for r in sorted(records, key=lambda r: r["finished"])]
+    out_of_order = sum(
+        1 for i in range(len(by_finish)) for j in range(i + 1, len(by_finish))
+        if by_finish[i] > by_finish[j]
+    )
+
+    return {
+        "requests": len(records),
+        "ok": len(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "max_ms": max(latencies) if latencies else None,
+        "statuses": dict(statuses),
+        "rate_limited": statuses.get("429", 0),
+        "guard_rewrites": guard_rewrites,
+        "duplicate_replies": duplicates,
+        "out_of_order": out_of_order
+    }
+
+
+def summarize_rounds(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Latency over every request; loop-guard/ordering counts are per burst and summed"""
+    overall = summarize(records)
+    for key in ("guard_rewrites", "duplicate_replies", "out_of_order"):
+        overall[key] = sum(
+            summarize([r for r in records if r["round"] == n])[key]
+            for n in sorted({r["round"] for r in records})
+        )
+    return overall
+
+
+def run_contention_benchmark(scenario: Dict[str, Any], url: str, timeout: float,
+                             burst: int = 5, rounds: int = 3, stagger_ms: float = 50,
+                             cooldown: float = 60) -> Dict[str, Any]:
+    """
+    Alternate isolated and shared bursts for `rounds` rounds
+    `cooldown` seconds separate every burst so the worker's per-IP window
+    (1 minute by default) does not leak 429s from one phase into the next
+    """
+    run_id = uuid.uuid4().hex[:8]
+    phases = {"isolated": [], "shared": []}
+    base = dict(scenario["payload"])
+    # The worker keys state on `session`; legacy payloads also carry sessionId
+    session_keys = ["session"] + (["sessionId"] if "sessionId" in base else [])
+
+    for round_no in range(rounds):
+        for phase in ("isolated", "shared"):
+            if phases["isolated"] or phases["shared"]:
+                time.sleep(cooldown)
+            payloads = []
+            for i in range(burst):
+                payload = dict(base)
+                if phase == "shared":
+                    session = f"bench-shared-{run_id}-{round_no}"
+                else:
+                    session = f"bench-iso-{run_id}-{round_no}-{i}"
+                for key in session_keys:
+                    payload[key] = session
+                payloads.append(payload)
+            records = fire_burst(url, timeout, payloads, stagger_ms)
+            for r in records:
+                r["round"] = round_no
+            phases[phase].extend(records)
+
+    isolated = summarize_rounds(phases["isolated"])
+    shared = summarize_rounds(phases["shared"])
+    return {
+        "scenario": scenario["name"],
+        "worker_url": url,
+        "burst": burst,
+        "rounds": rounds,
+        "stagger_ms": stagger_ms,
+        "isolated": isolated,
+        "shared": shared,
+        "added_latency_ms": {
+            key: (shared[key] - isolated[key]) if shared[key] is not None and isolated[key] is not None else None
+            for key in ("p50_ms", "p95_ms")
+        },
+        # Identical shared-session replies the loop guard should have caught
+        "lost_updates": shared["duplicate_replies"]
+    }
+
+
+def print_report(report: Dict[str, Any], output: str = None):
+    """Side-by-side table; full report as JSON to `output` if given"""
+    iso, shared = report["isolated"], report["shared"]
+    print(f"\n{BLUE}{'='*60}{RESET}")
+    print(f"{BLUE}SAME-SESSION CONTENTION BENCHMARK{RESET}")
+    print(f"{BLUE}{'='*60}{RESET}\n")
+    print(f"Scenario: {report['scenario']}")
+    print(f"Bursts: {report['rounds']} x {report['burst']} requests, {report['stagger_ms']:g}ms apart\n")
+
+    def cell(value):
+        return "-" if value is None else str(value)
+
+    rows = [
+        ("OK responses", "ok"),
+        ("p50 ms", "p50_ms"),
+        ("p95 ms", "p95_ms"),
+        ("max ms", "max_ms"),
+        ("HTTP 429 (per-IP gate)", "rate_limited"),
+        ("Loop-guard rewrites", "guard_rewrites"),
+        ("Duplicate replies", "duplicate_replies"),
+        ("Out-of-order completions", "out_of_order")
+    ]
+    print(f"{'':<26}{'isolated':>10}{'shared':>10}")
+    for label, key in rows:
+        print(f"{label:<26}{cell(iso[key]):>10}{cell(shared[key]):>10}")
+
+    added = report["added_latency_ms"]
+    print(f"\nAdded latency (shared - isolated): p50 {cell(added['p50_ms'])}ms, p95 {cell(added['p95_ms'])}ms")
+    print(f"Lost updates (stale loop-guard reads): {report['lost_updates']}")
+    if iso["duplicate_replies"] == 0 and report["lost_updates"] == 0:
+        print(f"{YELLOW}Note:{RESET} the model never repeated itself across isolated sessions, "
+              f"so this run could not expose lost updates")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n{BLUE}Full report saved to:{RESET} {output}")
@@ -0,0 +1,141 @@
+"""
+Live terminal dashboard for in-progress runs
+Drains the metrics channel on its own thread and redraws a status block
+a few times per second; log lines are queued and printed above it
+"""
+
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Dict, List
+
+from harness.metrics import CHANNEL, MetricsChannel, percentile
+from harness.output import BLUE, GREEN, RED, RESET, YELLOW
+
+# Samples kept per mode for rolling percentiles
+LATENCY_WINDOW = 200
+# Seconds of completions used for the achieved-RPS figure
+RPS_WINDOW = 10.0
+
+
+class LiveDashboard(threading.Thread):
+    """Background renderer; workers never wait on it"""
+
+    def __init__(self, channel: MetricsChannel = CHANNEL, refresh_hz: float = 4.0, stream=None):
+        super().__init__(name="harness-dashboard", daemon=True)
+        self.channel = channel
+        self.interval = 1.0 / max(refresh_hz, 0.5)
+        self.stream = stream or sys.stdout
+        self._stop_event = threading.Event()
+        self._pending_lines = deque()
+        self._drawn_lines = 0
+
+        self.started_at = time.monotonic()
+        self.started = 0
+        self.finished = 0
+        self.passed = 0
+        self.failed = 0
+        self.latencies: Dict[str, deque] = {}
+        self.completions = deque()
+        self.errors = Counter()
+        self.rate_limited = Counter()
+
+    @staticmethod
+    def supported(stream=None) -> bool:
+        """The redraw relies on ANSI cursor movement, so require a TTY"""
+        stream = stream or sys.stdout
+        return hasattr(stream, "isatty") and stream.isatty()
+
+    def write(self, line: str = ""):
+        """Queue a log line to be printed above the status block"""
+        self._pending_lines.append(line)
+
+    def stop(self):
+        """Final redraw, then leave the last frame on screen"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self._refresh()
+            self._stop_event.wait(self.interval)
+        self._refresh()
+
+    def _refresh(self):
+        for event in self.channel.drain():
+            self._apply(event)
+        self._render()
+
+    def _apply(self, event: Dict):
+        kind = event["kind"]
+        if kind == "start":
+            self.started += 1
+        elif kind == "end":
+            self.finished += 1
+            self.completions.append(event["t"])
+            mode = event.get("mode") or "-"
+            window = self.latencies.setdefault(mode, deque(maxlen=LATENCY_WINDOW))
+            window.append(event["elapsed_ms"])
+
+            error = event.get("error")
+            if error == "http":
+                status = event.get("status")
+                self.errors[f"HTTP {status}"] += 1
+                if status == 429:
+                    self.rate_limited[event.get("error_code") or "unknown"] += 1
+            elif error:
+                self.errors[error] += 1
+        elif kind == "verdict":
+            if event["passed"]:
+                self.passed += 1
+            else:
+                self.failed += 1
+            if event.get("contract"):
+                self.errors["contract"] += 1
+
+    def _status_lines(self) -> List[str]:
+        now = time.monotonic()
+        while self.completions and now - self.completions[0] > RPS_WINDOW:
+            self.completions.popleft()
+        window = min(RPS_WINDOW, max(now - self.started_at, 1e-3))
+        rps = len(self.completions) / window
+        in_flight = self.started - self.finished
+
+        lines = [
+            f"{BLUE}{'-'*60}{RESET}",
+            f"{BLUE}LIVE{RESET}  in-flight: {in_flight}  done: {self.finished}  "
+            f"rps: {rps:.2f}  {GREEN}pass: {self.passed}{RESET}  {RED}fail: {self.failed}{RESET}"
+        ]
+
+        for mode in sorted(self.latencies):
+            samples = list(self.latencies[mode])
+            p50, p95, p99 = (percentile(samples, p) for p in (50, 95, 99))
+            lines.append(f"  {mode:<22} n={len(samples):<4} p50={p50}ms p95={p95}ms p99={p99}ms")
+
+        if self.errors:
+            breakdown = "  ".join(f"{k}: {v}" for k, v in sorted(self.errors.items()))
+            lines.append(f"  {YELLOW}errors{RESET}  {breakdown}")
+        else:
+            lines.append(f"  {YELLOW}errors{RESET}  none")
+
+        # The worker answers 429 only from its per-IP gate; an exhausted
+        # provider key pool surfaces as 502 provider_error (counted above)
+        total_429 = sum(self.rate_limited.values())
+        detail = ", ".join(f"{k}: {v}" for k, v in sorted(self.rate_limited.items()))
+        lines.append(f"  429s    {total_429}" + (f" ({detail})" if detail else ""))
+        return lines
+
+    def _render(self):
+        out = []
+        if self._drawn_lines:
+            # Move to the start of the previous frame and clear it
+            out.append(f"\033[{self._drawn_lines}F\033[J")
+        while self._pending_lines:
+            out.append(self._pending_lines.popleft() + "\n")
+        frame = self._status_lines()
+        out.append("\n".join(frame) + "\n")
+        self._drawn_lines = len(frame)
+        self.stream.write("".join(out))
+        self.stream.flush()
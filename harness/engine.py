@@ -0,0 +1,225 @@
+"""
+Scenario execution engine
+Runs /chat scenarios (optionally on a worker pool) and publishes every
+request to the metrics channel so observers never touch the hot path
+"""
+
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from harness.metrics import CHANNEL
+from harness.profiling import PROFILER
+from harness.sampling import SequentialSampler
+
+# A check takes (response_json, elapsed_ms) and returns
+# (named checks, failure details, excerpt stored with the result)
+CheckFn = Callable[[Dict[str, Any], int], Tuple[List[Tuple[str, bool]], str, Any]]
+
+
+def post_chat(url: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """POST a /chat payload, time it and publish start/end events"""
+    mode = payload.get("mode", "")
+    result = {
+        "status": None,
+        "data": None,
+        "text": "",
+        "elapsed": 0,
+        "error": None,
+        "error_code": None,
+        "detail": ""
+    }
+
+    CHANNEL.publish("start", mode=mode)
+    start_time = time.time()
+    try:
+        with PROFILER.phase("request"):
+            resp = requests.post(f"{url}/chat", json=payload, timeout=timeout)
+        result["elapsed"] = int((time.time() - start_time) * 1000)
+        PROFILER.record_request(result["elapsed"])
+        result["status"] = resp.status_code
+        with PROFILER.phase("decode"):
+            result["text"] = resp.text
+            try:
+                result["data"] = resp.json()
+            except ValueError:
+                result["data"] = None
+
+        if resp.status_code != 200:
+            result["error"] = "http"
+            result["detail"] = f"HTTP {resp.status_code}"
+            if isinstance(result["data"], dict):
+                result["error_code"] = result["data"].get("error")
+        elif not isinstance(result["data"], dict):
+            result["error"] = "invalid_json"
+            result["detail"] = "Response is not a JSON object"
+    except requests.Timeout as e:
+        result["elapsed"] = int((time.time() - start_time) * 1000)
+        result["error"] = "timeout"
+        result["detail"] = str(e)
+    except requests.RequestException as e:
+        result["elapsed"] = int((time.time() - start_time) * 1000)
+        result["error"] = "network"
+        result["detail"] = str(e)
+
+    CHANNEL.publish(
+        "end",
+        mode=mode,
+        elapsed_ms=result["elapsed"],
+        status=result["status"],
+        error=result["error"],
+        error_code=result["error_code"]
+    )
+    return result
+
+
+def run_scenario(scenario: Dict[str, Any], url: str, timeout: float) -> Dict[str, Any]:
+    """Execute one scenario and evaluate its checks"""
+    PROFILER.take_client_ms()  # start this scenario's client CPU from zero
+    result = post_chat(url, scenario["payload"], timeout)
+    outcome = {
+        "name": scenario["name"],
+        "mode": scenario["payload"].get("mode", ""),
+        "passed": False,
+        "details": result["detail"],
+        "excerpt": result["text"][:100] if result["error"] else None,
+        "failed_checks": [],
+        "elapsed": result["elapsed"],
+        "status": result["status"],
+        "error": result["error"]
+    }
+
+    if not result["error"]:
+        with PROFILER.phase("check"):
+            try:
+                checks, details, excerpt = scenario["check"](result["data"], result["elapsed"])
+                outcome["passed"] = all(check[1] for check in checks)
+                outcome["failed_checks"] = [name for name, ok in checks if not ok]
+                outcome["details"] = details if not outcome["passed"] else f"{result['elapsed']}ms ✓"
+                outcome["excerpt"] = excerpt
+            except Exception as e:
+                outcome["details"] = str(e)
+
+    client_ms = PROFILER.take_client_ms()
+    if client_ms is not None:
+        outcome["client_ms"] = client_ms
+
+    CHANNEL.publish(
+        "verdict",
+        mode=outcome["mode"],
+        passed=outcome["passed"],
+        contract=not outcome["passed"] and not result["error"]
+    )
+    return outcome
+
+
+def fresh_session(payload: Dict[str, Any], suffix: str) -> Dict[str, Any]:
+    """
+    Copy of a payload on its own worker session
+    The worker's loop guard rewrites a reply that repeats the previous one
+    in the same session, and it keys that state on `session` alone, so
+    legacy sessionId-only payloads would otherwise all share "anon"
+    """
+    payload = dict(payload)
+    session = f"{payload.get('session') or payload.get('sessionId') or 'harness'}-{suffix}"
+    payload["session"] = session
+    if "sessionId" in payload:
+        payload["sessionId"] = session
+    return payload
+
+
+def transport_error(outcome: Dict[str, Any]) -> Optional[str]:
+    """
+    Label for failures that say nothing about the reply contract: timeouts,
+    network errors, the per-IP 429 gate and 5xx (e.g. an exhausted key pool)
+    """
+    if outcome["error"] in ("timeout", "network"):
+        return outcome["error"]
+    if outcome["error"] == "http" and (outcome["status"] == 429 or outcome["status"] >= 500):
+        return f"HTTP {outcome['status']}"
+    return None
+
+
+def sample_scenario(scenario: Dict[str, Any], url: str, timeout: float,
+                    sampler: SequentialSampler) -> Dict[str, Any]:
+    """
+    Re-run a scenario until the sampler settles it (or max samples)
+    Transport errors use up attempts but stay out of the pass rate, and
+    only HTTP 200 latencies feed the p95 estimate
+    """
+    passes = 0
+    n = 0
+    attempts = 0
+    latencies = []
+    elapsed_total = 0
+    client_ms = None
+    failed_checks = Counter()
+    transport_errors = Counter()
+    outcome = None
+    assessment = None
+
+    while True:
+        attempts += 1
+        payload = fresh_session(scenario["payload"], f"s{attempts}")
+        outcome = run_scenario(dict(scenario, payload=payload), url, timeout)
+        # run_scenario restarts the client CPU counter, so sum it per attempt
+        elapsed_total += outcome["elapsed"]
+        if "client_ms" in outcome:
+            client_ms = (client_ms or 0.0) + outcome["client_ms"]
+
+        error = transport_error(outcome)
+        if error:
+            transport_errors[error] += 1
+        else:
+            n += 1
+            if outcome["status"] == 200:
+                latencies.append(outcome["elapsed"])
+            if outcome["passed"]:
+                passes += 1
+            else:
+                failed_checks.update(outcome["failed_checks"] or [outcome["details"]])
+
+        assessment = sampler.assess(passes, n, latencies)
+        if assessment["settled"] or attempts >= sampler.max_samples:
+            break
+
+    assessment["attempts"] = attempts
+    # Attempts, not contract samples, hit the cap when transport errors occur
+    assessment["exhausted"] = not assessment["settled"]
+    assessment["transport_errors"] = dict(transport_errors)
+    passed = n > 0 and sampler.verdict(assessment)
+    summary = sampler.describe(assessment)
+    if client_ms is not None:
+        outcome = dict(outcome, client_ms=round(client_ms, 2))
+    return dict(
+        outcome,
+        elapsed_total=elapsed_total,
+        passed=passed,
+        details=summary if passed else f"{summary} | last: {outcome['details']}",
+        failed_checks=[f"{name} ({count}/{assessment['samples']})"
+                       for name, count in failed_checks.most_common()],
+        sampling=assessment
+    )
+
+
+def run_scenarios(scenarios: List[Dict[str, Any]], url: str, timeout: float,
+                  workers: int = 1,
+                  sampler: Optional[SequentialSampler] = None) -> Iterator[Dict[str, Any]]:
+    """Yield outcomes; in order when sequential, as completed on a pool"""
+    def execute(scenario):
+        if sampler is None:
+            return run_scenario(scenario, url, timeout)
+        return sample_scenario(scenario, url, timeout, sampler)
+
+    if workers <= 1:
+        for scenario in scenarios:
+            yield execute(scenario)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(execute, s) for s in scenarios]
+        for future in as_completed(futures):
+            yield future.result()
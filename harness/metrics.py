@@ -0,0 +1,52 @@
+"""
+Metrics channel between request workers and observers (dashboard, reports)
+
+Workers only ever append to a deque; observers drain it from their own
+thread. deque.append/popleft are atomic in CPython, so publishing never
+takes a lock or waits on a slow consumer.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+# Bounded so a stalled consumer can never grow memory without limit
+CHANNEL_CAPACITY = 10000
+
+
+class MetricsChannel:
+    """Single-consumer event queue fed by request workers"""
+
+    def __init__(self, capacity: int = CHANNEL_CAPACITY):
+        self._events = deque(maxlen=capacity)
+
+    def publish(self, kind: str, **fields: Any):
+        """Append an event; never blocks the caller"""
+        fields["kind"] = kind
+        fields["t"] = time.monotonic()
+        self._events.append(fields)
+
+    def drain(self, limit: int = CHANNEL_CAPACITY) -> List[Dict[str, Any]]:
+        """Pop up to `limit` pending events in publish order"""
+        out = []
+        popleft = self._events.popleft
+        for _ in range(limit):
+            try:
+                out.append(popleft())
+            except IndexError:
+                break
+        return out
+
+
+# Process-wide channel the engine publishes to
+CHANNEL = MetricsChannel()
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (pct in 0-100), None for no data"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
@@ -0,0 +1,211 @@
+"""
+Continuous synthetic monitoring
+Runs a small rotating slice of the scenario matrix on a fixed interval and
+serves the results on a local /metrics endpoint in OpenMetrics text format
+
+Histograms and counters are cumulative (scrapers derive rates); pass
+ratio and latency quantiles are gauges over a bounded rolling window
+"""
+
+import signal
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import requests
+
+from harness.engine import run_scenario
+from harness.metrics import percentile
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Seconds; tuned to LLM-backed /chat latencies (TIMEOUT is 30 s)
+LATENCY_BUCKETS = [0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30]
+
+# Hard cap on rolling observations per mode, on top of the time window
+WINDOW_MAXLEN = 5000
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class MonitorState:
+    """Cumulative and rolling metrics shared by the scheduler and the HTTP thread"""
+
+    def __init__(self, retention_seconds: float):
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self.created = time.time()
+        self.histograms: Dict[str, Dict[str, Any]] = {}
+        self.runs: Dict[tuple, int] = {}
+        self.errors: Dict[tuple, int] = {}
+        self.windows: Dict[str, deque] = {}
+        self.last_pass: Dict[tuple, int] = {}
+        self.health_up = None
+        self.last_cycle = None
+
+    def observe(self, scenario: Dict[str, Any], outcome: Dict[str, Any]):
+        """Record one scenario outcome"""
+        mode = outcome["mode"]
+        seconds = outcome["elapsed"] / 1000.0
+        now = time.time()
+        with self._lock:
+            hist = self.histograms.setdefault(mode, {
+                "buckets": [0] * len(LATENCY_BUCKETS), "count": 0, "sum": 0.0
+            })
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    hist["buckets"][i] += 1
+            hist["count"] += 1
+            hist["sum"] += seconds
+
+            result = "pass" if outcome["passed"] else "fail"
+            self.runs[(mode, result)] = self.runs.get((mode, result), 0) + 1
+            error = outcome.get("error") or ("contract" if not outcome["passed"] else None)
+            if error:
+                self.errors[(mode, error)] = self.errors.get((mode, error), 0) + 1
+
+            self.last_pass[(scenario["suite"], scenario["name"])] = int(outcome["passed"])
+            window = self.windows.setdefault(mode, deque(maxlen=WINDOW_MAXLEN))
+            window.append((now, seconds, outcome["passed"]))
+            self._trim(now)
+
+    def set_health(self, up: bool):
+        with self._lock:
+            self.health_up = int(up)
+            self.last_cycle = time.time()
+
+    def _trim(self, now: float):
+        for window in self.windows.values():
+            while window and now - window[0][0] > self.retention_seconds:
+                window.popleft()
+
+    def render(self) -> str:
+        """OpenMetrics text exposition"""
+        with self._lock:
+            self._trim(time.time())
+            out: List[str] = []
+
+            out.append("# TYPE reflectiv_chat_request_duration_seconds histogram")
+            out.append("# UNIT reflectiv_chat_request_duration_seconds seconds")
+            out.append("# HELP reflectiv_chat_request_duration_seconds Synthetic /chat latency by mode.")
+            for mode, hist in sorted(self.histograms.items()):
+                for bound, count in zip(LATENCY_BUCKETS, hist["buckets"]):
+                    out.append(f"reflectiv_chat_request_duration_seconds_bucket{_labels(mode=mode, le=str(float(bound)))} {count}")
+                out.append(f"reflectiv_chat_request_duration_seconds_bucket{_labels(mode=mode, le='+Inf')} {hist['count']}")
+                out.append(f"reflectiv_chat_request_duration_seconds_count{_labels(mode=mode)} {hist['count']}")
+                out.append(f"reflectiv_chat_request_duration_seconds_sum{_labels(mode=mode)} {hist['sum']:.3f}")
+                out.append(f"reflectiv_chat_request_duration_seconds_created{_labels(mode=mode)} {self.created:.3f}")
+
+            out.append("# TYPE reflectiv_scenario_runs counter")
+            out.append("# HELP reflectiv_scenario_runs Synthetic scenario runs by mode and result.")
+            for (mode, result), count in sorted(self.runs.items()):
+                out.append(f"reflectiv_scenario_runs_total{_labels(mode=mode, result=result)} {count}")
+
+            out.append("# TYPE reflectiv_scenario_errors counter")
+            out.append("# HELP reflectiv_scenario_errors Failures by kind: http, timeout, network, invalid_json, contract.")
+            for (mode, kind), count in sorted(self.errors.items()):
+                out.append(f"reflectiv_scenario_errors_total{_labels(mode=mode, kind=kind)} {count}")
+
+            out.append("# TYPE reflectiv_scenario_pass_ratio gauge")
+            out.append(f"# HELP reflectiv_scenario_pass_ratio Pass ratio over the last {int(self.retention_seconds)}s.")
+            for mode, window in sorted(self.windows.items()):
+                if window:
+                    ratio = sum(1 for _, _, ok in window if ok) / len(window)
+                    out.append(f"reflectiv_scenario_pass_ratio{_labels(mode=mode)} {ratio:.4f}")
+
+            out.append("# TYPE reflectiv_chat_latency_window_seconds gauge")
+            out.append("# UNIT reflectiv_chat_latency_window_seconds seconds")
+            out.append(f"# HELP reflectiv_chat_latency_window_seconds Latency quantiles over the last {int(self.retention_seconds)}s.")
+            for mode, window in sorted(self.windows.items()):
+                samples = [s for _, s, _ in window]
+                for pct in (50, 95, 99):
+                    value = percentile(samples, pct)
+                    if value is not None:
+                        out.append(f"reflectiv_chat_latency_window_seconds{_labels(mode=mode, percentile=str(pct))} {value:.3f}")
+
+            out.append("# TYPE reflectiv_scenario_last_pass gauge")
+            out.append("# HELP reflectiv_scenario_last_pass 1 if the scenario's most recent run passed.")
+            for (suite, name), value in sorted(self.last_pass.items()):
+                out.append(f"reflectiv_scenario_last_pass{_labels(suite=suite, scenario=name)} {value}")
+
+            if self.health_up is not None:
+                out.append("# TYPE reflectiv_worker_health_up gauge")
+                out.append("# HELP reflectiv_worker_health_up 1 if GET /health returned 200 on the last cycle.")
+                out.append(f"reflectiv_worker_health_up {self.health_up}")
+                out.append("# TYPE reflectiv_monitor_last_cycle_timestamp_seconds gauge")
+                out.append("# UNIT reflectiv_monitor_last_cycle_timestamp_seconds seconds")
+                out.append("# HELP reflectiv_monitor_last_cycle_timestamp_seconds Start of the last monitoring cycle.")
+                out.append(f"reflectiv_monitor_last_cycle_timestamp_seconds {self.last_cycle:.3f}")
+
+            out.append("# EOF")
+            return "\n".join(out) + "\n"
+
+
+def _handler_for(state: MonitorState):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] == "/metrics":
+                body = state.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+            elif self.path == "/healthz":
+                body = b"ok\n"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain")
+            else:
+                body = b"not found\n"
+                self.send_response(404)
+                self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
+
+
+def run_daemon(scenarios: List[Dict[str, Any]], worker_url: str, timeout: float,
+               interval: float = 60, slice_size: int = 2, host: str = "127.0.0.1",
+               port: int = 9464, retention_seconds: float = 3600) -> int:
+    """Serve /metrics and run `slice_size` scenarios every `interval` seconds until stopped"""
+    state = MonitorState(retention_seconds)
+    server = ThreadingHTTPServer((host, port), _handler_for(state))
+    threading.Thread(target=server.serve_forever, name="harness-metrics", daemon=True).start()
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    print(f"Monitoring {worker_url}: {slice_size} of {len(scenarios)} scenarios every {interval:g}s")
+    print(f"Metrics on http://{host}:{server.server_address[1]}/metrics")
+
+    position = 0
+    while not stop.is_set():
+        started = time.monotonic()
+        try:
+            up = requests.get(f"{worker_url}/health", timeout=10).status_code == 200
+        except requests.RequestException:
+            up = False
+        state.set_health(up)
+
+        for _ in range(min(slice_size, len(scenarios))):
+            if stop.is_set():
+                break
+            scenario = scenarios[position % len(scenarios)]
+            position += 1
+            state.observe(scenario, run_scenario(scenario, worker_url, timeout))
+
+        stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    server.shutdown()
+    return 0
@@ -0,0 +1,217 @@
+"""
+Pluggable output formats
+Built-ins: text (colored console + JSON results file), json, junit.
+Third-party formats load with --format package.module:ClassName
+"""
+
+import importlib
+import json
+from typing import Any, Callable, Dict
+
+# Color codes for output
+GREEN = '\033[92m'
+RED = '\033[91m'
+YELLOW = '\033[93m'
+BLUE = '\033[94m'
+RESET = '\033[0m'
+
+DEFAULT_RESULTS_FILE = "COMPREHENSIVE_DEPLOYMENT_TEST_RESULTS.json"
+# Partial selections must not overwrite the deployment evidence file
+SELECTION_RESULTS_FILE = "SELECTED_TEST_RESULTS.json"
+
+FORMATTERS: Dict[str, type] = {}
+
+
+def register_formatter(name: str):
+    """Class decorator adding a formatter under --format <name>"""
+    def decorator(cls):
+        FORMATTERS[name] = cls
+        return cls
+    return decorator
+
+
+def get_formatter(spec: str) -> type:
+    """Resolve a built-in name or a module:Class path"""
+    if ":" in spec:
+        module_name, _, class_name = spec.partition(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        if not (isinstance(cls, type) and issubclass(cls, Formatter)):
+            raise ValueError(f"{spec} is not a harness.output.Formatter subclass")
+        return cls
+    if spec not in FORMATTERS:
+        raise ValueError(f"unknown format '{spec}' (built-in: {', '.join(sorted(FORMATTERS))})")
+    return FORMATTERS[spec]
+
+
+class Formatter:
+    """
+    Base formatter; every hook is optional
+    `write` prints one line and is swapped for the dashboard while it runs
+    """
+
+    def __init__(self, write: Callable[[str], None] = print, output: str = None):
+        self.write = write
+        self.output = output
+
+    def header(self, results: Dict[str, Any]):
+        pass
+
+    def category(self, index: int, title: str):
+        pass
+
+    def result(self, record: Dict[str, Any]):
+        pass
+
+    def finish(self, results: Dict[str, Any]):
+        pass
+
+    def _dump(self, text: str):
+        """Write the final document to --output, or stdout"""
+        if self.output:
+            with open(self.output, "w") as f:
+                f.write(text)
+        else:
+            print(text)
+
+
+@register_formatter("text")
+class TextFormatter(Formatter):
+    """Colored PASS/FAIL lines, final report and a JSON results file"""
+
+    def header(self, results):
+        self.write(f"{BLUE}{'='*60}{RESET}")
+        self.write(f"{BLUE}COMPREHENSIVE PRE-DEPLOYMENT TEST SUITE{RESET}")
+        self.write(f"{BLUE}Worker: {results['worker_url']}{RESET}")
+        self.write(f"{BLUE}Timestamp: {results['timestamp']}{RESET}")
+        self.write(f"{BLUE}{'='*60}{RESET}")
+
+    def category(self, index, title):
+        self.write(f"\n{BLUE}{'='*60}{RESET}")
+        self.write(f"{BLUE}TEST CATEGORY {index}: {title}{RESET}")
+        self.write(f"{BLUE}{'='*60}{RESET}\n")
+
+    def result(self, record):
+        if record["passed"]:
+            self.write(f"{GREEN}✅ PASS{RESET}: {record['name']}")
+            return
+        self.write(f"{RED}❌ FAIL{RESET}: {record['name']}")
+        if record["details"]:
+            self.write(f"  {YELLOW}Reason:{RESET} {record['details']}")
+        for check_name in record.get("failed_checks") or []:
+            self.write(f"    {RED}✗{RESET} {check_name}")
+
+    def finish(self, results):
+        self.write(f"\n{BLUE}{'='*60}{RESET}")
+        self.write(f"{BLUE}FINAL TEST REPORT{RESET}")
+        self.write(f"{BLUE}{'='*60}{RESET}\n")
+
+        total = results["total_tests"]
+        passed = results["passed"]
+        failed = results["failed"]
+        pass_rate = (passed / total * 100) if total > 0 else 0
+
+        self.write(f"Total Tests: {total}")
+        self.write(f"{GREEN}Passed: {passed}{RESET}")
+        self.write(f"{RED}Failed: {failed}{RESET}")
+        self.write(f"Pass Rate: {pass_rate:.1f}%\n")
+
+        if "sampling" in results:
+            self.write(f"Sequential sampling: {results['requests_sent']} /chat requests "
+                       f"(max {results['sampling']['max_samples']} per scenario)\n")
+
+        if "profile" in results:
+            self._profile(results["profile"], results["tests"])
+
+        coverage = results.get("deployment_coverage")
+        if pass_rate == 100 and coverage and coverage["selected"] < coverage["total"]:
+            self.write(f"{GREEN}{'='*60}{RESET}")
+            self.write(f"{GREEN}✅ ALL SELECTED TESTS PASSED{RESET}")
+            self.write(f"{GREEN}{'='*60}{RESET}\n")
+            self.write(f"{YELLOW}Only {coverage['selected']} of {coverage['total']} deployment tests ran; "
+                       f"run the full deployment suite before deploying{RESET}")
+        elif pass_rate == 100:
+            self.write(f"{GREEN}{'='*60}{RESET}")
+            self.write(f"{GREEN}🎉 ALL TESTS PASSED - READY FOR DEPLOYMENT{RESET}")
+            self.write(f"{GREEN}{'='*60}{RESET}\n")
+
+            self.write(f"{BLUE}DEPLOYMENT COMMAND:{RESET}")
+            self.write(f"cd /Users/anthonyabdelmalak/Desktop/reflectiv-ai")
+            self.write(f"wrangler deploy worker.js")
+            self.write(f"git add worker.js widget.js")
+            self.write(f'git commit -m "fix: comprehensive EI scoring and mode validation fixes"')
+            self.write(f"git push origin DEPLOYMENT_PROMPT.md")
+        else:
+            self.write(f"{RED}{'='*60}{RESET}")
+            self.write(f"{RED}⚠️  TESTS FAILED - DO NOT DEPLOY{RESET}")
+            self.write(f"{RED}{'='*60}{RESET}\n")
+
+            self.write(f"{YELLOW}Failed Tests:{RESET}")
+            for test in results["tests"]:
+                if not test["passed"]:
+                    self.write(f"  {RED}✗{RESET} {test['name']}: {test['details']}")
+
+        # Save results to file
+        output_file = self.output
+        if output_file is None:
+            full = not coverage or coverage["selected"] >= coverage["total"]
+            output_file = DEFAULT_RESULTS_FILE if full else SELECTION_RESULTS_FILE
+        with open(output_file, "w") as f:
+            json.dump(results, f, indent=2)
+
+        self.write(f"\n{BLUE}Full results saved to:{RESET} {output_file}\n")
+
+
+    def _profile(self, profile, tests):
+        # Per-test client CPU is only final once its own output is printed,
+        # so it is listed here rather than on the PASS/FAIL line
+        self.write(f"{BLUE}Harness profile{RESET} ({profile['requests']} requests)")
+        self.write(f"  {'test':<48}{'elapsed ms':>11}{'client ms':>11}")
+        for test in tests:
+            if "client_ms" in test:
+                self.write(f"  {test['name']:<48}{test['elapsed_ms']:>11}{test['client_ms']:>11}")
+        self.write("")
+        self.write(f"  {'phase':<10}{'calls':>7}{'cpu ms':>10}{'ms/call':>10}{'alloc KB':>10}{'peak KB':>10}")
+        for name, p in profile["phases"].items():
+            alloc = "-" if p["alloc_kb"] is None else p["alloc_kb"]
+            peak = "-" if p["peak_kb"] is None else p["peak_kb"]
+            self.write(f"  {name:<10}{p['calls']:>7}{p['cpu_ms']:>10}{p['cpu_ms_per_call']:>10}"
+                       f"{alloc:>10}{peak:>10}")
+        self.write(f"  Overhead per request: {profile['overhead_ms_per_request']}ms client CPU, "
+                   f"{profile['overhead_share_of_elapsed']:.1%} of measured elapsed")
+        self.write(f"  Process CPU utilization: {profile['cpu_utilization']:.0%}")
+        for spot in profile.get("hotspots", []):
+            self.write(f"    {spot['tottime_ms']:>9}ms {spot['calls']:>6}x  {spot['function']}")
+        if profile["saturated"]:
+            for warning in profile["warnings"]:
+                self.write(f"  {RED}⚠️  CLIENT-BOUND RUN{RESET}: {warning}")
+        self.write("")
+
+
+@register_formatter("json")
+class JsonFormatter(Formatter):
+    """Silent while running; the full results document at the end"""
+
+    def finish(self, results):
+        self._dump(json.dumps(results, indent=2))
+
+
+@register_formatter("junit")
+class JUnitFormatter(Formatter):
+    """JUnit XML for CI test reporters"""
+
+    def finish(self, results):
+        import xml.etree.ElementTree as ET
+
+        suite = ET.Element(
+            "testsuite",
+            name="reflectiv-harness",
+            tests=str(results["total_tests"]),
+            failures=str(results["failed"]),
+            timestamp=results["timestamp"]
+        )
+        for test in results["tests"]:
+            case = ET.SubElement(suite, "testcase", classname=test.get("suite", "harness"), name=test["name"])
+            if not test["passed"]:
+                failure = ET.SubElement(case, "failure", message=test["details"] or "failed")
+                failure.text = "\n".join(test.get("failed_checks") or [])
+        self._dump(ET.tostring(suite, encoding="unicode"))
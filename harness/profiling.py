@@ -0,0 +1,240 @@
+"""
+Harness self-profiling
+Attributes client-side CPU (per-thread time.thread_time) and, on request,
+allocations (tracemalloc) to the phases of each request, so harness
+overhead can be separated from worker latency and saturated runs can be
+flagged. tracemalloc hooks every allocation and roughly doubles the CPU it
+is meant to sit beside, so allocation tracing is a separate opt-in.
+
+Phases: request (building, sending and reading the HTTP exchange; this
+CPU is inside the reported elapsed), decode (resp.json), check (contract
+checks and excerpt) and report (result record and console output).
+Disabled by default; phase() is then a shared no-op context.
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+# Client CPU above this share of the measured elapsed inflates latencies
+OVERHEAD_SHARE_LIMIT = 0.05
+# Process CPU / wall time above this means the interpreter (one core under
+# the GIL) is the bottleneck and requests queue inside the harness
+CPU_SATURATION_LIMIT = 0.7
+
+PHASES = ["request", "decode", "check", "report"]
+
+# From 3.12 cProfile sits on sys.monitoring: one active profiler per
+# process, covering every thread, so per-thread profiles cannot coexist
+PROCESS_WIDE_CPROFILE = sys.version_info >= (3, 12)
+
+_NOOP = nullcontext()
+
+
+class HarnessProfiler:
+    """Per-phase CPU/allocation totals, optionally with cProfile (per thread before 3.12)"""
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiles: List[Any] = []
+        self.use_cprofile = False
+        self.trace_allocations = False
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.requests = 0
+        self.elapsed_ms = 0.0
+        self.request_cpu_ms = 0.0
+        self._started = None
+
+    def start(self, cprofile: bool = False, allocations: bool = False):
+        """Begin collecting; tracemalloc only runs when allocations are asked for"""
+        import tracemalloc
+
+        self.trace_allocations = allocations
+        if allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.use_cprofile = cprofile and not PROCESS_WIDE_CPROFILE
+        if cprofile and PROCESS_WIDE_CPROFILE:
+            import cProfile
+
+            profile = cProfile.Profile(time.thread_time)
+            profile.enable()
+            self._profiles.append(profile)
+        self.phases = {name: {"calls": 0, "cpu_ms": 0.0, "wall_ms": 0.0,
+                              "alloc_kb": 0.0, "peak_kb": 0.0} for name in PHASES}
+        self._started = (time.perf_counter(), time.process_time())
+        self.enabled = True
+
+    def stop(self):
+        import tracemalloc
+
+        self.enabled = False
+        self._disable_process_profile()
+        if self.trace_allocations:
+            tracemalloc.stop()
+
+    def _disable_process_profile(self):
+        if PROCESS_WIDE_CPROFILE:
+            for profile in self._profiles:
+                profile.disable()
+
+    def phase(self, name: str):
+        """Context manager timing one phase on the calling thread"""
+        if not self.enabled:
+            return _NOOP
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str):
+        import tracemalloc
+
+        profile = self._thread_profile() if self.use_cprofile else None
+        tracing = self.trace_allocations
+        reset_peak = None
+        if tracing:
+            mem_start = tracemalloc.get_traced_memory()[0]
+            # The peak is process-wide and reset_peak is too: exact with one
+            # worker, but with overlapping phases another thread's reset can
+            # lower it or its allocations raise it, so it is approximate.
+            # reset_peak is 3.9+; before that only net allocation is kept
+            reset_peak = getattr(tracemalloc, "reset_peak", None)
+            if reset_peak is not None:
+                reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler (a debugger, coverage) owns the hook
+                profile = None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            cpu_ms = (time.thread_time() - cpu_start) * 1000
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+            self._local.client_ms = getattr(self._local, "client_ms", 0.0) + cpu_ms
+            if name == "request":
+                self._local.request_cpu_ms = cpu_ms
+            with self._lock:
+                stats = self.phases[name]
+                stats["calls"] += 1
+                stats["cpu_ms"] += cpu_ms
+                stats["wall_ms"] += wall_ms
+                if tracing:
+                    stats["alloc_kb"] += max(current - mem_start, 0) / 1024
+                    if reset_peak is None:
+                        peak = current
+                    stats["peak_kb"] = max(stats["peak_kb"], (peak - mem_start) / 1024)
+
+    def _thread_profile(self):
+        profile = getattr(self._local, "profile", None)
+        if profile is None:
+            import cProfile
+
+            # Thread CPU clock, so hotspots exclude time blocked on the socket
+            profile = self._local.profile = cProfile.Profile(time.thread_time)
+            with self._lock:
+                self._profiles.append(profile)
+        return profile
+
+    def record_request(self, elapsed_ms: float):
+        """One /chat exchange: its measured elapsed and the client CPU inside it"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.requests += 1
+            self.elapsed_ms += elapsed_ms
+            self.request_cpu_ms += getattr(self._local, "request_cpu_ms", 0.0)
+
+    def take_client_ms(self) -> Optional[float]:
+        """Client CPU on this thread since the last call, or None when disabled"""
+        if not self.enabled:
+            return None
+        value = getattr(self._local, "client_ms", 0.0)
+        self._local.client_ms = 0.0
+        return round(value, 2)
+
+    def report(self, top: int = 8) -> Dict[str, Any]:
+        """Summary for results["profile"], including the saturation verdict"""
+        self._disable_process_profile()
+        wall = time.perf_counter() - self._started[0]
+        cpu = time.process_time() - self._started[1]
+        with self._lock:
+            phases = {
+                name: {
+                    "calls": s["calls"],
+                    "cpu_ms": round(s["cpu_ms"], 1),
+                    "cpu_ms_per_call": round(s["cpu_ms"] / s["calls"], 3) if s["calls"] else 0,
+                    "wall_ms": round(s["wall_ms"], 1),
+                    "alloc_kb": round(s["alloc_kb"], 1) if self.trace_allocations else None,
+                    "peak_kb": round(s["peak_kb"], 1) if self.trace_allocations else None
+                }
+                for name, s in self.phases.items()
+            }
+            requests = self.requests
+            elapsed_ms = self.elapsed_ms
+            request_cpu_ms = self.request_cpu_ms
+
+        client_ms = sum(p["cpu_ms"] for p in phases.values())
+        cpu_utilization = cpu / wall if wall > 0 else 0
+        overhead_share = request_cpu_ms / elapsed_ms if elapsed_ms > 0 else 0
+
+        warnings = []
+        if cpu_utilization > CPU_SATURATION_LIMIT:
+            warnings.append(f"harness process busy {cpu_utilization:.0%} of wall time; "
+                            f"requests likely queued client-side")
+        if overhead_share > OVERHEAD_SHARE_LIMIT:
+            warnings.append(f"client CPU is {overhead_share:.1%} of measured elapsed; "
+                            f"latencies overstate the worker")
+
+        report = {
+            "requests": requests,
+            "phases": phases,
+            "overhead_ms_per_request": round(client_ms / requests, 3) if requests else None,
+            "overhead_share_of_elapsed": round(overhead_share, 4),
+            "cpu_utilization": round(cpu_utilization, 3),
+            "saturated": bool(warnings),
+            "warnings": warnings
+        }
+        if self._collected():
+            report["hotspots"] = self._hotspots(top)
+        return report
+
+    def _hotspots(self, top: int) -> List[Dict[str, Any]]:
+        stats = self.stats()
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+        return [
+            {"function": f"{file}:{line}({func})", "calls": nc, "tottime_ms": round(tt * 1000, 2)}
+            for (file, line, func), (cc, nc, tt, ct, callers) in rows
+        ]
+
+    def _collected(self) -> List[Any]:
+        """Profiles that recorded anything; pstats rejects empty ones"""
+        collected = []
+        for profile in self._profiles:
+            profile.create_stats()
+            if profile.stats:
+                collected.append(profile)
+        return collected
+
+    def stats(self):
+        """Merged pstats.Stats over every profile that ran"""
+        import pstats
+
+        return pstats.Stats(*self._collected())
+
+    def dump(self, path: str):
+        if self._collected():
+            self.stats().dump_stats(path)
+
+
+# Process-wide profiler the engine and runner report phases to
+PROFILER = HarnessProfiler()
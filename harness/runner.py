@@ -0,0 +1,134 @@
+"""
+One harness run: health check, /chat categories and result bookkeeping
+Results keep the COMPREHENSIVE_DEPLOYMENT_TEST_RESULTS.json shape
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+import requests
+
+from harness.cache import ResultCache
+from harness.engine import run_scenarios
+from harness.output import Formatter
+from harness.profiling import PROFILER
+from harness.sampling import SequentialSampler
+from harness.scenarios import CATEGORIES, HEALTH_CHECK
+
+
+def fetch_worker_version(worker_url: str) -> str:
+    """Deployed worker version, folded into incremental fingerprints"""
+    try:
+        resp = requests.get(f"{worker_url}/version", timeout=10)
+        return resp.json().get("version", "unknown")
+    except Exception:
+        return "unknown"
+
+
+class Run:
+    """Counters and per-test records for a single invocation"""
+
+    def __init__(self, formatter: Formatter, worker_url: str, timeout: float):
+        self.formatter = formatter
+        self.worker_url = worker_url
+        self.timeout = timeout
+        self.results = {
+            "timestamp": datetime.now().isoformat(),
+            "worker_url": worker_url,
+            "total_tests": 0,
+            "passed": 0,
+            "failed": 0,
+            "tests": []
+        }
+
+    @property
+    def pass_rate(self) -> float:
+        total = self.results["total_tests"]
+        return (self.results["passed"] / total * 100) if total > 0 else 0
+
+    def log_test(self, name: str, passed: bool, details: str = "", response_data: Any = None,
+                 failed_checks: List[str] = None, suite: str = "deployment") -> Dict[str, Any]:
+        """Log test result"""
+        with PROFILER.phase("report"):
+            self.results["total_tests"] += 1
+            if passed:
+                self.results["passed"] += 1
+            else:
+                self.results["failed"] += 1
+
+            record = {
+                "name": name,
+                "suite": suite,
+                "passed": passed,
+                "details": details,
+                "failed_checks": failed_checks or [],
+                "response_excerpt": str(response_data)[:200] if response_data else None
+            }
+            self.results["tests"].append(record)
+            self.formatter.result(record)
+        return record
+
+    def test_worker_health(self):
+        """Test 1: Worker health check"""
+        self.formatter.category(1, HEALTH_CHECK["category"])
+
+        try:
+            resp = requests.get(f"{self.worker_url}/health", timeout=10)
+            self.log_test(
+                HEALTH_CHECK["name"],
+                resp.status_code == 200,
+                f"Status: {resp.status_code}",
+                resp.text
+            )
+        except Exception as e:
+            self.log_test(HEALTH_CHECK["name"], False, str(e))
+
+    def run_chat_categories(self, scenarios: List[Dict[str, Any]], workers: int = 1,
+                            sampler: SequentialSampler = None, cache: ResultCache = None,
+                            fingerprints: Dict[str, str] = None):
+        """Run /chat scenarios category by category"""
+        categories = list(enumerate(CATEGORIES, start=2))
+        if cache is not None:
+            # Categories holding a previously failing scenario run first
+            categories.sort(key=lambda item: not any(
+                cache.previously_failed(s["name"]) for s in scenarios if s["category"] == item[1]
+            ))
+
+        if sampler is not None:
+            self.results["requests_sent"] = 0
+
+        for index, category in categories:
+            selected = [s for s in scenarios if s["category"] == category]
+            if not selected:
+                continue
+
+            self.formatter.category(index, category)
+            suites = {s["name"]: s["suite"] for s in selected}
+            if cache is not None:
+                selected, reused = cache.plan(selected, fingerprints)
+                for scenario, entry in reused:
+                    self.log_test(f"{scenario['name']} (cached)", True, entry["details"],
+                                  entry["excerpt"], suite=scenario["suite"])
+
+            for outcome in run_scenarios(selected, self.worker_url, self.timeout, workers, sampler):
+                if sampler is not None:
+                    self.results["requests_sent"] += outcome["sampling"]["attempts"]
+                if cache is not None:
+                    cache.record(outcome["name"], fingerprints[outcome["name"]], outcome)
+                # Drop report CPU this thread spent on the health check and
+                # cached entries; with a pool it would land on this outcome
+                PROFILER.take_client_ms()
+                record = self.log_test(
+                    outcome["name"],
+                    outcome["passed"],
+                    outcome["details"],
+                    outcome["excerpt"],
+                    outcome["failed_checks"],
+                    suites[outcome["name"]]
+                )
+                if "client_ms" in outcome:
+                    # The report phase just ran on this thread; add it to the
+                    # request/decode/check CPU taken in run_scenario (summed
+                    # over every attempt when sampling)
+                    record["elapsed_ms"] = outcome.get("elapsed_total", outcome["elapsed"])
+                    record["client_ms"] = round(outcome["client_ms"] + PROFILER.take_client_ms(), 2)
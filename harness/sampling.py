@@ -0,0 +1,117 @@
+"""
+Sequential sampling for stochastic /chat scenarios
+A scenario is re-run only until its contract pass rate and p95 latency
+are settled at the requested confidence, instead of a fixed sample count
+"""
+
+import math
+from statistics import NormalDist, mean, stdev
+from typing import Any, Dict, List, Optional, Tuple
+
+# z for the 95th percentile of a standard normal, used by the p95 estimate
+Z_P95 = NormalDist().inv_cdf(0.95)
+
+
+def wilson_interval(successes: int, n: int, z: float) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion"""
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def p95_interval(latencies: List[float], z: float) -> Optional[Tuple[float, float, float]]:
+    """
+    p95 estimate and interval assuming log-normal latencies
+    Returns (low, estimate, high) in ms, or None with fewer than 2 samples
+    """
+    logs = [math.log(max(v, 1)) for v in latencies]
+    n = len(logs)
+    if n < 2:
+        return None
+    mu, sigma = mean(logs), stdev(logs)
+    estimate = mu + Z_P95 * sigma
+    # Delta-method standard error of mu + z_p * sigma
+    se = sigma * math.sqrt(1 / n + Z_P95 * Z_P95 / (2 * (n - 1)))
+    return math.exp(estimate - z * se), math.exp(estimate), math.exp(estimate + z * se)
+
+
+class SequentialSampler:
+    """Stopping rule shared by every scenario in a run"""
+
+    def __init__(self, confidence: float = 0.9, target_pass_rate: float = 0.8,
+                 latency_budget_ms: float = 30000, min_samples: int = 3,
+                 max_samples: int = 30, max_width: float = 0.25,
+                 latency_tolerance: float = 0.25):
+        self.confidence = confidence
+        self.target_pass_rate = target_pass_rate
+        self.latency_budget_ms = latency_budget_ms
+        self.min_samples = max(2, min_samples)
+        self.max_samples = max(self.min_samples, max_samples)
+        self.max_width = max_width
+        self.latency_tolerance = latency_tolerance
+        # One-sided bounds: we only ask "above or below the target?"
+        self.z = NormalDist().inv_cdf(confidence)
+
+    def assess(self, passes: int, n: int, latencies: List[float]) -> Dict[str, Any]:
+        """Current estimates plus whether sampling can stop"""
+        low, high = wilson_interval(passes, n, self.z)
+        rate_settled = (
+            low >= self.target_pass_rate
+            or high < self.target_pass_rate
+            or high - low <= self.max_width
+        )
+
+        p95 = p95_interval(latencies, self.z)
+        if p95 is None:
+            latency_settled = False
+        else:
+            p95_low, p95_est, p95_high = p95
+            latency_settled = (
+                p95_high <= self.latency_budget_ms
+                or p95_low > self.latency_budget_ms
+                or (p95_high - p95_low) / (2 * p95_est) <= self.latency_tolerance
+            )
+
+        settled = n >= self.min_samples and rate_settled and latency_settled
+        return {
+            "samples": n,
+            "passes": passes,
+            "pass_rate": passes / n if n else 0.0,
+            "pass_rate_interval": (low, high),
+            "p95_ms": p95,
+            "settled": settled,
+            "exhausted": not settled and n >= self.max_samples
+        }
+
+    def verdict(self, assessment: Dict[str, Any]) -> bool:
+        """Pass when the bounds clear both gates, point estimates otherwise"""
+        low, high = assessment["pass_rate_interval"]
+        if low >= self.target_pass_rate:
+            rate_ok = True
+        elif high < self.target_pass_rate:
+            rate_ok = False
+        else:
+            rate_ok = assessment["pass_rate"] >= self.target_pass_rate
+        p95 = assessment["p95_ms"]
+        latency_ok = p95 is None or p95[1] <= self.latency_budget_ms
+        return rate_ok and latency_ok
+
+    @staticmethod
+    def describe(assessment: Dict[str, Any]) -> str:
+        """One-line summary used in test details"""
+        low, high = assessment["pass_rate_interval"]
+        text = (f"n={assessment['samples']} pass {assessment['passes']}/{assessment['samples']} "
+                f"[{low:.2f}-{high:.2f}]")
+        if assessment["p95_ms"]:
+            p95_low, p95_est, p95_high = assessment["p95_ms"]
+            text += f" | p95≈{p95_est:.0f}ms [{p95_low:.0f}-{p95_high:.0f}]"
+        if assessment.get("transport_errors"):
+            excluded = ", ".join(f"{k} x{v}" for k, v in sorted(assessment["transport_errors"].items()))
+            text += f" | excluded: {excluded}"
+        if assessment["exhausted"]:
+            text += " | unsettled at max samples"
+        return text
@@ -0,0 +1,355 @@
+"""
+Scenario catalogue for both test suites
+Pure data and check functions: no network imports, so listing and
+filtering stay fast
+"""
+
+from typing import Any, Dict, List
+
+from harness.config import CANONICAL_METRICS
+
+
+def check_sales_coach(data: Dict[str, Any], elapsed: int):
+    """Sales Coach contract: four sections plus full EI scoring"""
+    reply = data.get("reply", "")
+    coach = data.get("coach", {})
+    scores = coach.get("scores", {})
+
+    # Validation checks
+    checks = []
+
+    # Check 1: Response exists
+    checks.append(("Response exists", len(reply) > 0))
+
+    # Check 2: Has required sections (Challenge, Rep Approach, Impact, Suggested Phrasing)
+    has_challenge = "Challenge:" in reply or "challenge" in reply.lower()
+    has_rep = "Rep Approach:" in reply or "approach" in reply.lower()
+    has_impact = "Impact:" in reply or "impact" in reply.lower()
+    has_phrasing = "Suggested Phrasing:" in reply or "phrasing" in reply.lower()
+    checks.append(("Has Challenge section", has_challenge))
+    checks.append(("Has Rep Approach section", has_rep))
+    checks.append(("Has Impact section", has_impact))
+    checks.append(("Has Suggested Phrasing section", has_phrasing))
+
+    # Check 3: Coach object exists
+    checks.append(("Coach object present", len(coach) > 0))
+
+    # Check 4: Scores exist
+    checks.append(("Scores present", len(scores) > 0))
+
+    # Check 5: All 10 EI metrics present
+    metrics_present = [m for m in CANONICAL_METRICS if m in scores]
+    checks.append(("All EI metrics present", len(metrics_present) == len(CANONICAL_METRICS)))
+
+    # Check 6: Scores are valid (1-5)
+    valid_scores = all(1 <= scores.get(m, 0) <= 5 for m in metrics_present)
+    checks.append(("Scores valid (1-5)", valid_scores))
+
+    # Check 7: No invalid "accuracy" metric
+    checks.append(("No invalid 'accuracy' metric", "accuracy" not in scores))
+
+    # Check 8: Response time acceptable (<30s)
+    checks.append(("Response time acceptable", elapsed < 30000))
+
+    details = f"{elapsed}ms | Metrics: {len(metrics_present)}/10 | Sections: C:{has_challenge} R:{has_rep} I:{has_impact} P:{has_phrasing}"
+    return checks, details, {"reply_length": len(reply), "metrics": list(scores.keys())}
+
+def check_role_play(data: Dict[str, Any], elapsed: int):
+    """Role Play contract: natural HCP voice with no coaching leakage"""
+    reply = data.get("reply", "")
+    coach = data.get("coach", {})
+
+    # Validation checks
+    checks = []
+
+    # Check 1: Response exists and is natural (not too long)
+    checks.append(("Response exists", len(reply) > 0))
+    checks.append(("Natural length (not verbose)", len(reply) < 1000))
+
+    # Check 2: NO coaching sections (mode isolation)
+    has_coaching = any(x in reply for x in [
+        "Challenge:", "Rep Approach:", "Impact:",
+        "Suggested Phrasing:", "Coach Guidance:"
+    ])
+    checks.append(("No coaching sections", not has_coaching))
+
+    # Check 3: NO meta-commentary
+    has_meta = any(x in reply.lower() for x in [
+        "you should", "the rep should", "try saying"
+    ])
+    checks.append(("No meta-commentary", not has_meta))
+
+    # Check 4: First person (HCP voice)
+    has_first_person = any(x in reply.lower() for x in ["i ", "i'm", "we ", "my "])
+    checks.append(("HCP first person voice", has_first_person))
+
+    # Check 5: Coach scores present (for final evaluation)
+    checks.append(("Coach scores available", "scores" in coach))
+
+    details = f"{elapsed}ms | Length: {len(reply)} | 1st person: {has_first_person} | No coaching: {not has_coaching}"
+    return checks, details, {"reply_preview": reply[:100]}
+
+def check_emotional_assessment(data: Dict[str, Any], elapsed: int):
+    """Emotional Assessment contract: reflective reply with flat EI scores"""
+    reply = data.get("reply", "")
+    coach = data.get("coach", {})
+    scores = coach.get("scores", {})
+
+    checks = []
+
+    # Check 1: Response is reflective/coaching
+    checks.append(("Response exists", len(reply) > 0))
+    checks.append(("Substantial response", len(reply) > 100))
+
+    # Check 2: Has Socratic questions
+    has_questions = "?" in reply
+    checks.append(("Contains reflective questions", has_questions))
+
+    # Check 3: EI scores present
+    checks.append(("EI scores present", len(scores) > 0))
+
+    # Check 4: All 10 metrics
+    metrics_present = [m for m in CANONICAL_METRICS if m in scores]
+    checks.append(("All EI metrics present", len(metrics_present) == len(CANONICAL_METRICS)))
+
+    # Check 5: Proper path (no .ei nesting)
+    # We can only check this from the response structure
+    checks.append(("Flat coach structure", "scores" in coach and "ei" not in coach))
+
+    details = f"{elapsed}ms | Metrics: {len(metrics_present)}/10 | Questions: {has_questions}"
+    return checks, details, {"metrics": list(scores.keys())}
+
+def check_product_knowledge(data: Dict[str, Any], elapsed: int):
+    """Product Knowledge contract: cited, factual, not coaching"""
+    reply = data.get("reply", "")
+
+    checks = []
+
+    # Check 1: Response exists
+    checks.append(("Response exists", len(reply) > 0))
+
+    # Check 2: Has references/citations
+    has_references = any(x in reply for x in [
+        "http://", "https://", "[", "]", "Reference", "Source"
+    ])
+    checks.append(("Has references/citations", has_references))
+
+    # Check 3: Clinical/factual (not coaching)
+    is_factual = not any(x in reply for x in [
+        "Challenge:", "Rep Approach:", "You should"
+    ])
+    checks.append(("Factual (not coaching)", is_factual))
+
+    # Check 4: Reasonable length (not too short)
+    checks.append(("Substantial answer", len(reply) > 50))
+
+    details = f"{elapsed}ms | Length: {len(reply)} | Has refs: {has_references}"
+    return checks, details, {"reply_preview": reply[:150]}
+
+def check_schema(data: Dict[str, Any], elapsed: int):
+    """Schema contract: flat coach.scores object"""
+    coach = data.get("coach", {})
+
+    # Schema checks
+    checks = []
+
+    # Check 1: Coach object present
+    checks.append(("Coach object exists", len(coach) > 0))
+
+    # Check 2: Flat structure (no .ei nesting)
+    checks.append(("Flat structure (no .ei)", "ei" not in coach))
+    checks.append(("Has scores key", "scores" in coach))
+
+    # Check 3: Scores is object, not nested
+    if "scores" in coach:
+        scores = coach["scores"]
+        checks.append(("Scores is dict", isinstance(scores, dict)))
+        checks.append(("Scores not empty", len(scores) > 0))
+
+    return checks, f"Keys: {list(coach.keys())}", {"coach_keys": list(coach.keys())}
+
+def check_ei_scoring(data: Dict[str, Any], elapsed: int):
+    """EI scoring contract: coach.scores carries exactly the 10 canonical metrics"""
+    coach = data.get("coach", {})
+    scores = coach.get("scores", {}) if isinstance(coach, dict) else {}
+    rationales = coach.get("rationales", {}) if isinstance(coach, dict) else {}
+
+    missing_metrics = [m for m in CANONICAL_METRICS if m not in scores]
+    invalid_metrics = [k for k in scores if k not in CANONICAL_METRICS]
+    rationale_count = sum(1 for m in CANONICAL_METRICS if m in rationales)
+
+    checks = [
+        ("Coach object exists", "coach" in data),
+        ("No incorrect .ei nesting", "ei" not in coach),
+        (".scores object at correct path", "scores" in coach),
+        ("All 10 canonical metrics present", not missing_metrics),
+        ("No invalid metrics (e.g. 'accuracy')", not invalid_metrics)
+    ]
+
+    details = (f"{elapsed}ms | Metrics: {len(scores)}/10 | Missing: {', '.join(missing_metrics) or '-'} "
+               f"| Invalid: {', '.join(invalid_metrics) or '-'}")
+    return checks, details, {"metrics": scores, "rationaleCount": rationale_count}
+
+def build_scenarios() -> List[Dict[str, Any]]:
+    """Every /chat scenario across both suites, in category order"""
+    scenarios = []
+
+    # Test 2-6: Sales Coach mode (all therapeutic areas)
+    therapeutic_areas = [
+        ("HIV", "Difficult HCP", "Start one patient on PrEP this month"),
+        ("Oncology", "Busy Oncologist", "Discuss new treatment protocol"),
+        ("Cardiovascular", "Engaged Cardiologist", "Review heart failure management"),
+        ("COVID-19", "Skeptical Physician", "Discuss updated treatment guidelines"),
+        ("Vaccines", "Busy NP", "Increase vaccination rates")
+    ]
+    for disease, persona, goal in therapeutic_areas:
+        scenarios.append({
+            "name": f"Sales Coach - {disease}",
+            "suite": "deployment",
+            "category": "SALES COACH MODE",
+            "check": check_sales_coach,
+            "payload": {
+                "mode": "sales-coach",
+                "user": f"How should I approach discussing {disease} with this HCP?",
+                "history": [],
+                "disease": disease,
+                "persona": persona,
+                "goal": goal,
+                "session": f"test-sales-coach-{disease.lower()}"
+            }
+        })
+
+    # Test 7-9: Role Play mode (3 personas)
+    personas = [
+        ("Difficult HCP", "HIV", "I don't have time for this."),
+        ("Engaged Physician", "Oncology", "Tell me more about the clinical data."),
+        ("Busy NP", "Vaccines", "We're already stretched thin.")
+    ]
+    for persona, disease, expected_tone in personas:
+        scenarios.append({
+            "name": f"Role Play - {persona}",
+            "suite": "deployment",
+            "category": "ROLE PLAY MODE",
+            "check": check_role_play,
+            "payload": {
+                "mode": "role-play",
+                "user": "I'd like to discuss how we can help more patients.",
+                "history": [],
+                "disease": disease,
+                "persona": persona,
+                "goal": "Build rapport",
+                "session": f"test-roleplay-{persona.replace(' ', '-')}"
+            }
+        })
+
+    # Test 10: Emotional Assessment mode
+    scenarios.append({
+        "name": "Emotional Assessment",
+        "suite": "deployment",
+        "category": "EMOTIONAL ASSESSMENT MODE",
+        "check": check_emotional_assessment,
+        "payload": {
+            "mode": "emotional-assessment",
+            "user": "I struggled to handle the HCP's objections today. They said they don't have time.",
+            "history": [],
+            "disease": "HIV",
+            "persona": "Difficult HCP",
+            "goal": "Improve objection handling",
+            "session": "test-ei-assessment"
+        }
+    })
+
+    # Test 11-15: Product Knowledge mode (all therapeutic areas)
+    questions = [
+        ("HIV", "What are the key eligibility criteria for PrEP?"),
+        ("Oncology", "What are the latest immunotherapy options for lung cancer?"),
+        ("Cardiovascular", "What's the role of SGLT2 inhibitors in heart failure?"),
+        ("COVID-19", "What are current treatment options for hospitalized patients?"),
+        ("Vaccines", "What's the recommended HPV vaccination schedule?")
+    ]
+    for disease, question in questions:
+        scenarios.append({
+            "name": f"Product Knowledge - {disease}",
+            "suite": "deployment",
+            "category": "PRODUCT KNOWLEDGE MODE",
+            "check": check_product_knowledge,
+            "payload": {
+                "mode": "product-knowledge",
+                "user": question,
+                "history": [],
+                "disease": disease,
+                "persona": "",
+                "goal": "",
+                "session": f"test-pk-{disease.lower()}"
+            }
+        })
+
+    # Test 16: Schema validation consistency
+    for mode in ["sales-coach", "role-play", "emotional-assessment"]:
+        scenarios.append({
+            "name": f"Schema validation - {mode}",
+            "suite": "deployment",
+            "category": "SCHEMA VALIDATION",
+            "check": check_schema,
+            "payload": {
+                "mode": mode,
+                "user": "Test message for schema validation",
+                "history": [],
+                "disease": "HIV",
+                "persona": "Engaged Physician",
+                "goal": "Test",
+                "session": f"test-schema-{mode}"
+            }
+        })
+
+    # EI scoring suite (formerly test_ei_scoring.py); uses the legacy
+    # message/conversation/sessionId request shape on purpose
+    ei_scenarios = [
+        ("Sales Coach - HIV PrEP discussion", {
+            "mode": "sales-coach",
+            "message": "I understand your concerns about patient adherence. Based on the DISCOVER trial data, Descovy for PrEP has shown excellent efficacy. How do you currently discuss PrEP options with at-risk patients?"
+        }),
+        ("Role Play - Difficult HCP, HIV", {
+            "mode": "role-play",
+            "persona": "difficult",
+            "disease": "HIV",
+            "message": "I appreciate you taking the time to meet with me today. I wanted to discuss how Descovy for PrEP might benefit your at-risk patient population."
+        }),
+        ("Emotional Assessment - Self-reflection", {
+            "mode": "emotional-assessment",
+            "message": "Tell me about a recent challenging interaction with an HCP where you felt frustrated."
+        })
+    ]
+    for number, (description, body) in enumerate(ei_scenarios, start=1):
+        payload = dict(body, conversation=[], sessionId=f"test-ei-scoring-{number}")
+        scenarios.append({
+            "name": f"EI Scoring - {description}",
+            "suite": "ei-scoring",
+            "category": "EI SCORING",
+            "check": check_ei_scoring,
+            "payload": payload
+        })
+
+    return scenarios
+
+# Category order matches the numbered TEST CATEGORY banners
+# (category 1, INFRASTRUCTURE, is the health check)
+CATEGORIES = [
+    "SALES COACH MODE",
+    "ROLE PLAY MODE",
+    "EMOTIONAL ASSESSMENT MODE",
+    "PRODUCT KNOWLEDGE MODE",
+    "SCHEMA VALIDATION",
+    "EI SCORING"
+]
+
+SUITES = ["deployment", "ei-scoring"]
+
+# The GET /health check, described like a scenario so selection and
+# --list treat it uniformly
+HEALTH_CHECK = {
+    "name": "Worker health endpoint",
+    "suite": "deployment",
+    "category": "INFRASTRUCTURE",
+    "payload": {"mode": "health"}
+}
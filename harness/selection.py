@@ -0,0 +1,98 @@
+"""
+-k style scenario selection
+Expressions combine case-insensitive substring terms with and/or/not and
+parentheses, matched against a scenario's name, suite, category, mode,
+disease and persona, e.g. "sales-coach and (hiv or oncology)"
+"""
+
+import re
+from typing import Any, Dict, List
+
+_TOKEN = re.compile(r"\s*(\(|\)|[^\s()]+)")
+
+
+def keywords(scenario: Dict[str, Any]) -> str:
+    """Lower-cased text a -k term may match"""
+    payload = scenario.get("payload", {})
+    fields = [
+        scenario.get("name", ""),
+        scenario.get("suite", ""),
+        scenario.get("category", ""),
+        payload.get("mode", ""),
+        payload.get("disease", ""),
+        payload.get("persona", "")
+    ]
+    return " | ".join(str(f) for f in fields if f).lower()
+
+
+class _Parser:
+    """expr := term ('or' term)*; term := factor ('and' factor)*; factor := 'not' factor | '(' expr ')' | word"""
+
+    def __init__(self, expression: str, text: str):
+        self.tokens = _TOKEN.findall(expression)
+        self.pos = 0
+        self.text = text
+
+    def _peek(self):
+        return self.tokens[self.pos].lower() if self.pos < len(self.tokens) else None
+
+    def _take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> bool:
+        result = self._expr()
+        if self._peek() is not None:
+            raise ValueError(f"unexpected '{self.tokens[self.pos]}' in -k expression")
+        return result
+
+    def _expr(self) -> bool:
+        result = self._term()
+        while self._peek() == "or":
+            self._take()
+            rhs = self._term()
+            result = result or rhs
+        return result
+
+    def _term(self) -> bool:
+        result = self._factor()
+        while self._peek() == "and":
+            self._take()
+            rhs = self._factor()
+            result = result and rhs
+        return result
+
+    def _factor(self) -> bool:
+        token = self._peek()
+        if token is None:
+            raise ValueError("incomplete -k expression")
+        if token == "not":
+            self._take()
+            return not self._factor()
+        if token == "(":
+            self._take()
+            result = self._expr()
+            if self._peek() != ")":
+                raise ValueError("missing ')' in -k expression")
+            self._take()
+            return result
+        if token in ("and", "or", ")"):
+            raise ValueError(f"unexpected '{token}' in -k expression")
+        return self._take().lower() in self.text
+
+
+def matches(expression: str, scenario: Dict[str, Any]) -> bool:
+    """True when the scenario satisfies the -k expression (empty matches all)"""
+    if not expression or not expression.strip():
+        return True
+    return _Parser(expression, keywords(scenario)).parse()
+
+
+def select(scenarios: List[Dict[str, Any]], expression: str = "",
+           suites: List[str] = None) -> List[Dict[str, Any]]:
+    """Filter by suite and -k expression, keeping catalogue order"""
+    return [
+        s for s in scenarios
+        if (not suites or s.get("suite") in suites) and matches(expression, s)
+    ]
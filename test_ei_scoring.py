@@ -3,6 +3,10 @@
 EI Scoring Integration Test
 Tests the complete flow: UI → Worker → AI → Parser → UI
 Validates PHASE 2 fixes: correct path, all 10 metrics, no invalid metrics
+
+Verbose single-shot diagnostic over the harness's ei-scoring scenarios and
+contract check; the same suite runs non-verbosely with
+reflectiv-harness --suite ei-scoring
 """
 
 import requests
@@ -10,65 +14,25 @@ import json
 import time
 from datetime import datetime
 
-WORKER_URL = "https://my-chat-agent-v2.tonyabdelmalak.workers.dev"
-
-# Expected 10 metrics (NO "accuracy" or "ei" nesting)
-CANONICAL_METRICS = [
-    "empathy",
-    "clarity",
-    "compliance",
-    "discovery",
-    "objection_handling",
-    "confidence",
-    "active_listening",
-    "adaptability",
-    "action_insight",
-    "resilience"
-]
-
-# Test scenarios
-test_scenarios = [
-    {
-        "mode": "sales-coach",
-        "message": "I understand your concerns about patient adherence. Based on the DISCOVER trial data, Descovy for PrEP has shown excellent efficacy. How do you currently discuss PrEP options with at-risk patients?",
-        "description": "Sales Coach - HIV PrEP discussion"
-    },
-    {
-        "mode": "role-play",
-        "persona": "difficult",
-        "disease": "HIV",
-        "message": "I appreciate you taking the time to meet with me today. I wanted to discuss how Descovy for PrEP might benefit your at-risk patient population.",
-        "description": "Role Play - Difficult HCP, HIV"
-    },
-    {
-        "mode": "emotional-assessment",
-        "message": "Tell me about a recent challenging interaction with an HCP where you felt frustrated.",
-        "description": "Emotional Assessment - Self-reflection"
-    }
-]
+from harness.config import CANONICAL_METRICS, WORKER_URL
+from harness.engine import fresh_session
+from harness.scenarios import build_scenarios, check_ei_scoring
+
+# Test scenarios: the harness's ei-scoring suite
+test_scenarios = [s for s in build_scenarios() if s["suite"] == "ei-scoring"]
 
 
 def test_ei_scoring(scenario, test_number):
     """Test EI scoring for a single scenario"""
     print("\n" + "=" * 80)
-    print(f"TEST {test_number}: {scenario['description']}")
+    print(f"TEST {test_number}: {scenario['name']}")
     print("=" * 80)
 
-    body = {
-        "mode": scenario["mode"],
-        "message": scenario["message"],
-        "conversation": [],
-        "sessionId": f"test-{int(time.time())}-{test_number}"
-    }
-
-    if "persona" in scenario:
-        body["persona"] = scenario["persona"]
-    if "disease" in scenario:
-        body["disease"] = scenario["disease"]
+    body = fresh_session(scenario["payload"], str(int(time.time())))
 
     print(f"\n📤 REQUEST:")
-    print(f"Mode: {scenario['mode']}")
-    print(f"Message: {scenario['message'][:100]}...")
+    print(f"Mode: {body['mode']}")
+    print(f"Message: {body['message'][:100]}...")
 
     try:
         start_time = time.time()
@@ -87,65 +51,41 @@ def test_ei_scoring(scenario, test_number):
         print(f"\n📥 RESPONSE ({elapsed:.0f}ms):")
         print(f"Reply length: {len(data.get('reply', ''))} chars")
 
-        # CRITICAL VALIDATION: Check coach object structure
-        print(f"\n🔍 COACH OBJECT STRUCTURE:")
-
-        if "coach" not in data:
-            print(f"❌ FAIL: No coach object in response")
-            return {"success": False, "error": "Missing coach object"}
+        # Verdict comes from the harness contract; the rest is diagnostics
+        checks, details, excerpt = check_ei_scoring(data, int(elapsed))
+        success = all(ok for _, ok in checks)
 
-        print(f"✅ coach object exists")
+        print(f"\n🔍 CONTRACT CHECKS:")
+        for name, ok in checks:
+            print(f"{'✅' if ok else '❌'} {name}")
 
-        coach = data["coach"]
-
-        # Check for INCORRECT .ei nesting (should NOT exist)
+        coach = data.get("coach", {})
         if "ei" in coach:
-            print(f"❌ FAIL: Incorrect .ei nesting detected (should be flat .scores)")
             print(f"   Found: data.coach.ei = {str(coach['ei'])[:100]}")
-            return {"success": False, "error": "Invalid .ei nesting"}
-
-        print(f"✅ No incorrect .ei nesting")
-
-        # Check for CORRECT .scores object
-        if "scores" not in coach:
-            print(f"❌ FAIL: No .scores object in coach")
+        if "coach" in data and "scores" not in coach:
             print(f"   Coach keys: {', '.join(coach.keys())}")
-            return {"success": False, "error": "Missing .scores object"}
 
-        print(f"✅ .scores object exists at correct path")
+        scores = excerpt["metrics"]
+        missing_metrics = [m for m in CANONICAL_METRICS if m not in scores]
+        invalid_metrics = [k for k in scores if k not in CANONICAL_METRICS]
 
-        scores = coach["scores"]
         print(f"\n📊 SCORES VALIDATION:")
-
-        # Validate all 10 canonical metrics present
-        all_metrics_present = True
-        missing_metrics = []
-        invalid_metrics = []
-
         for metric in CANONICAL_METRICS:
-            if metric not in scores:
-                all_metrics_present = False
-                missing_metrics.append(metric)
-                print(f"❌ Missing metric: {metric}")
+            if metric in scores:
+                print(f"✅ {metric}: {scores[metric]}/5")
             else:
-                value = scores[metric]
-                print(f"✅ {metric}: {value}/5")
-
-        # Check for invalid metrics (e.g., "accuracy")
-        for key in scores.keys():
-            if key not in CANONICAL_METRICS:
-                invalid_metrics.append(key)
-                print(f"⚠️  Invalid metric detected: {key} = {scores[key]}")
+                print(f"❌ Missing metric: {metric}")
+        for key in invalid_metrics:
+            print(f"⚠️  Invalid metric detected: {key} = {scores[key]}")
 
         # Validate rationales
         print(f"\n📝 RATIONALES:")
         rationales = coach.get("rationales", {})
-        rationale_count = 0
         for metric in CANONICAL_METRICS:
             if metric in rationales:
-                rationale_count += 1
                 print(f"✅ {metric}: \"{rationales[metric][:60]}...\"")
 
+        rationale_count = excerpt["rationaleCount"]
         print(f"\nRationale coverage: {rationale_count}/{len(CANONICAL_METRICS)}")
 
         # Validate other coach fields
@@ -155,29 +95,22 @@ def test_ei_scoring(scenario, test_number):
         print(f"phrasing: \"{coach.get('phrasing', '')[:50]}...\"" if "phrasing" in coach else "phrasing: missing")
 
         # FINAL VERDICT
-        success = all_metrics_present and len(invalid_metrics) == 0 and "ei" not in coach
-
         print(f"\n" + "=" * 80)
         if success:
             print(f"✅ TEST {test_number} PASSED")
-            print(f"   - All 10 canonical metrics present")
-            print(f"   - No invalid metrics (e.g., \"accuracy\")")
-            print(f"   - Correct path (coach.scores, not coach.ei.scores)")
+            print(f"   - {details}")
             print(f"   - {rationale_count} rationales provided")
         else:
             print(f"❌ TEST {test_number} FAILED")
-            if missing_metrics:
-                print(f"   - Missing metrics: {', '.join(missing_metrics)}")
-            if invalid_metrics:
-                print(f"   - Invalid metrics: {', '.join(invalid_metrics)}")
-            if "ei" in coach:
-                print(f"   - Incorrect .ei nesting detected")
+            for name, ok in checks:
+                if not ok:
+                    print(f"   - {name}")
         print("=" * 80 + "\n")
 
         return {
             "success": success,
             "testNumber": test_number,
-            "scenario": scenario["description"],
+            "scenario": scenario["name"],
             "metrics": scores,
             "missingMetrics": missing_metrics,
             "invalidMetrics": invalid_metrics,
@@ -192,7 +125,7 @@ def test_ei_scoring(scenario, test_number):
         return {
             "success": False,
             "testNumber": test_number,
-            "scenario": scenario["description"],
+            "scenario": scenario["name"],
             "error": str(error)
         }
 
@@ -218,22 +151,11 @@ VALIDATION CRITERIA:
 
     results = []
 
-    # TEST 1
-    print("\n🧪 RUNNING TEST SET 1 (Sales Coach)")
-    test1 = test_ei_scoring(test_scenarios[0], 1)
-    results.append(test1)
-    time.sleep(2)  # 2s delay between tests
-
-    # TEST 2
-    print("\n🧪 RUNNING TEST SET 2 (Role Play)")
-    test2 = test_ei_scoring(test_scenarios[1], 2)
-    results.append(test2)
-    time.sleep(2)
-
-    # TEST 3 (FINAL)
-    print("\n🧪 RUNNING FINAL TEST (Emotional Assessment)")
-    test3 = test_ei_scoring(test_scenarios[2], 3)
-    results.append(test3)
+    for number, scenario in enumerate(test_scenarios, start=1):
+        if number > 1:
+            time.sleep(2)  # 2s delay between tests
+        print(f"\n🧪 RUNNING TEST SET {number} ({scenario['payload']['mode']})")
+        results.append(test_ei_scoring(scenario, number))
 
     # SUMMARY REPORT
     print("""
@@ -0,0 +1,146 @@
+"""Fingerprints, TTL and run ordering behind --incremental"""
+
+import json
+
+import pytest
+
+from harness import cache as cache_module
+from harness.cache import (MISSING, ResultCache, hash_file, hash_inputs, missing_inputs,
+                           resolve_repo_root, scenario_fingerprint)
+
+
+def check(data, elapsed):
+    return [], "", None
+
+
+def scenario(name, mode="sales-coach", **payload):
+    return {"name": name, "check": check, "payload": dict({"mode": mode}, **payload)}
+
+
+def outcome(passed):
+    return {"passed": passed, "details": "ok" if passed else "bad", "excerpt": None, "failed_checks": []}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def checkout(tmp_path):
+    for name in ("worker.js", "config.json", "citations.json"):
+        (tmp_path / name).write_text(name)
+    return tmp_path
+
+
+def test_hash_file_marks_absent_files(tmp_path):
+    assert hash_file(str(tmp_path / "nope.js")) == MISSING
+    (tmp_path / "worker.js").write_text("x")
+    assert hash_file(str(tmp_path / "worker.js")) != MISSING
+
+
+def test_missing_inputs_lists_every_absent_input(tmp_path):
+    (tmp_path / "worker.js").write_text("x")
+    assert missing_inputs(hash_inputs(str(tmp_path))) == ["citations.json", "config.json"]
+
+
+def test_resolve_repo_root_prefers_a_checkout_holding_worker_js(tmp_path, monkeypatch, checkout):
+    assert resolve_repo_root(str(checkout)) == str(checkout)
+    monkeypatch.chdir(tmp_path)
+    assert resolve_repo_root(str(tmp_path / "site-packages")) == str(tmp_path)
+
+
+def test_fingerprint_tracks_only_the_inputs_a_mode_depends_on(checkout):
+    before = hash_inputs(str(checkout))
+    (checkout / "citations.json").write_text("changed")
+    after = hash_inputs(str(checkout))
+
+    coach = scenario("coach", "sales-coach")
+    role_play = scenario("rp", "role-play")
+    assert scenario_fingerprint(coach, before) != scenario_fingerprint(coach, after)
+    assert scenario_fingerprint(role_play, before) == scenario_fingerprint(role_play, after)
+
+
+def test_fingerprint_changes_with_payload_and_extra(checkout):
+    hashes = hash_inputs(str(checkout))
+    base = scenario_fingerprint(scenario("a", user="hi"), hashes)
+    assert scenario_fingerprint(scenario("a", user="hello"), hashes) != base
+    assert scenario_fingerprint(scenario("a", user="hi"), hashes, extra="r10.2") != base
+
+
+def test_fingerprint_changes_when_check_code_changes(checkout, monkeypatch):
+    hashes = hash_inputs(str(checkout))
+    base = scenario_fingerprint(scenario("a"), hashes)
+
+    real_getsource = cache_module.inspect.getsource
+    monkeypatch.setattr(cache_module.inspect, "getsource",
+                        lambda obj: real_getsource(obj) + "\n# edited")
+    cache_module.check_source.cache_clear()
+    try:
+        assert scenario_fingerprint(scenario("a"), hashes) != base
+    finally:
+        monkeypatch.undo()
+        cache_module.check_source.cache_clear()
+    assert scenario_fingerprint(scenario("a"), hashes) == base
+
+
+def test_lookup_reuses_only_unchanged_passes_within_ttl(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "cache.json"), ttl_seconds=60)
+    cache.record("pass", "fp1", outcome(True))
+    cache.record("fail", "fp2", outcome(False))
+
+    assert cache.lookup("pass", "fp1")["details"] == "ok"
+    assert cache.lookup("pass", "other") is None
+    assert cache.lookup("fail", "fp2") is None
+    assert cache.lookup("unknown", "fp1") is None
+
+    clock[0] += 60
+    assert cache.lookup("pass", "fp1") is not None
+    clock[0] += 1
+    assert cache.lookup("pass", "fp1") is None
+
+
+def test_plan_runs_previous_failures_first_in_catalogue_order(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "cache.json"), ttl_seconds=60)
+    scenarios = [scenario(name) for name in ("a", "b", "c", "d", "e")]
+    fingerprints = {s["name"]: f"fp-{s['name']}" for s in scenarios}
+    cache.record("b", "fp-b", outcome(True))
+    cache.record("c", "fp-c", outcome(False))
+    cache.record("e", "fp-e", outcome(False))
+    cache.record("d", "stale", outcome(True))
+
+    to_run, reused = cache.plan(scenarios, fingerprints)
+    assert [s["name"] for s in to_run] == ["c", "e", "a", "d"]
+    assert [(s["name"], entry["details"]) for s, entry in reused] == [("b", "ok")]
+
+
+def test_plan_reruns_everything_once_the_ttl_expires(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "cache.json"), ttl_seconds=60)
+    scenarios = [scenario("a"), scenario("b")]
+    fingerprints = {"a": "fp-a", "b": "fp-b"}
+    for s in scenarios:
+        cache.record(s["name"], fingerprints[s["name"]], outcome(True))
+
+    clock[0] += 61
+    to_run, reused = cache.plan(scenarios, fingerprints)
+    assert [s["name"] for s in to_run] == ["a", "b"]
+    assert reused == []
+
+
+def test_save_round_trips_and_ignores_foreign_files(tmp_path, clock):
+    path = tmp_path / "cache.json"
+    cache = ResultCache(str(path), ttl_seconds=60)
+    cache.record("a", "fp-a", outcome(True))
+    cache.save()
+    assert ResultCache(str(path), ttl_seconds=60).lookup("a", "fp-a") is not None
+
+    path.write_text(json.dumps({"version": 0, "entries": {"a": {}}}))
+    assert ResultCache(str(path), ttl_seconds=60).entries == {}
+
+    path.write_text("[]")
+    assert ResultCache(str(path), ttl_seconds=60).entries == {}
+
+    path.write_text("{not json")
+    assert ResultCache(str(path), ttl_seconds=60).entries == {}
@@ -0,0 +1,41 @@
+"""Formatter resolution and the text formatter's results file"""
+
+import pytest
+
+from harness.output import (DEFAULT_RESULTS_FILE, SELECTION_RESULTS_FILE, JsonFormatter,
+                            TextFormatter, get_formatter)
+
+
+class NotAFormatter:
+    pass
+
+
+def test_get_formatter_resolves_names_and_plugins():
+    assert get_formatter("json") is JsonFormatter
+    assert get_formatter("harness.output:TextFormatter") is TextFormatter
+
+
+@pytest.mark.parametrize("spec", [f"{__name__}:NotAFormatter", "harness.output:DEFAULT_RESULTS_FILE"])
+def test_get_formatter_rejects_non_formatters(spec):
+    with pytest.raises(ValueError, match="not a harness.output.Formatter subclass"):
+        get_formatter(spec)
+
+
+def results(selected, total):
+    return {"total_tests": 1, "passed": 1, "failed": 0, "tests": [],
+            "deployment_coverage": {"selected": selected, "total": total}}
+
+
+@pytest.mark.parametrize("selected, expected", [(17, DEFAULT_RESULTS_FILE), (4, SELECTION_RESULTS_FILE)])
+def test_only_a_full_deployment_run_writes_the_deployment_results(tmp_path, monkeypatch, selected, expected):
+    monkeypatch.chdir(tmp_path)
+    TextFormatter(write=lambda line: None).finish(results(selected, 17))
+
+    assert [p.name for p in tmp_path.iterdir()] == [expected]
+
+
+def test_explicit_output_wins(tmp_path):
+    target = tmp_path / "out.json"
+    TextFormatter(write=lambda line: None, output=str(target)).finish(results(4, 17))
+
+    assert target.exists()
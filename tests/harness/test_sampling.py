@@ -0,0 +1,187 @@
+"""Stopping rule and interval estimates behind --adaptive"""
+
+import math
+
+import pytest
+
+from harness.sampling import SequentialSampler, p95_interval, wilson_interval
+
+
+@pytest.fixture
+def sampler():
+    return SequentialSampler(confidence=0.9, target_pass_rate=0.8, latency_budget_ms=30000,
+                             min_samples=3, max_samples=30)
+
+
+def test_wilson_interval_without_samples_is_uninformative():
+    assert wilson_interval(0, 0, 1.28) == (0.0, 1.0)
+
+
+def test_wilson_interval_is_clamped_and_contains_the_estimate():
+    low, high = wilson_interval(5, 5, 1.28)
+    assert high == 1.0
+    assert 0.75 < low < 0.76
+
+    low, high = wilson_interval(0, 3, 1.28)
+    assert low == 0.0
+    assert high < 0.8
+
+    low, high = wilson_interval(7, 10, 1.28)
+    assert low < 0.7 < high
+
+
+def test_p95_interval_needs_two_samples():
+    assert p95_interval([], 1.28) is None
+    assert p95_interval([1200], 1.28) is None
+
+
+def test_p95_interval_collapses_with_zero_variance():
+    low, estimate, high = p95_interval([1000, 1000, 1000], 1.28)
+    assert math.isclose(low, 1000) and math.isclose(estimate, 1000) and math.isclose(high, 1000)
+
+
+def test_p95_interval_widens_with_spread():
+    low, estimate, high = p95_interval([200, 800, 3000, 12000], 1.28)
+    assert low < estimate < high
+    assert estimate > 3000
+
+
+def test_never_settles_below_min_samples(sampler):
+    assessment = sampler.assess(2, 2, [1000, 1000])
+    assert not assessment["settled"]
+    assert not assessment["exhausted"]
+
+
+def test_all_pass_at_min_samples_is_still_too_wide(sampler):
+    # 3/3 gives [0.65, 1.0]: neither clear of the 0.8 target nor narrow enough
+    assessment = sampler.assess(3, 3, [1000] * 3)
+    assert not assessment["settled"]
+
+
+def test_narrow_interval_settles_without_clearing_the_target(sampler):
+    # 5/5 gives [0.75, 1.0]; the width exit (<= 0.25) stops sampling even
+    # though the lower bound is under 0.8, so the point estimate decides
+    assessment = sampler.assess(5, 5, [1000] * 5)
+    low, high = assessment["pass_rate_interval"]
+    assert low < sampler.target_pass_rate
+    assert high - low <= sampler.max_width
+    assert assessment["settled"]
+    assert sampler.verdict(assessment)
+
+
+def test_all_fail_settles_as_a_failure(sampler):
+    assessment = sampler.assess(0, 3, [1000] * 3)
+    assert assessment["settled"]
+    assert not sampler.verdict(assessment)
+
+
+def test_point_estimate_decides_an_ambiguous_interval(sampler):
+    above = sampler.assess(17, 20, [1000] * 20)
+    below = sampler.assess(15, 20, [1000] * 20)
+    assert above["pass_rate_interval"][0] < 0.8 < above["pass_rate_interval"][1]
+    assert below["pass_rate_interval"][0] < 0.8 < below["pass_rate_interval"][1]
+    assert sampler.verdict(above)
+    assert not sampler.verdict(below)
+
+
+def test_latency_over_budget_fails_even_when_every_check_passes(sampler):
+    assessment = sampler.assess(10, 10, [50000] * 10)
+    assert assessment["settled"]
+    assert not sampler.verdict(assessment)
+
+
+def test_exhausted_only_when_unsettled_at_max_samples():
+    sampler = SequentialSampler(min_samples=3, max_samples=4)
+    assessment = sampler.assess(3, 4, [1000, 1000, 1000, 1000])
+    assert not assessment["settled"]
+    assert assessment["exhausted"]
+    assert "unsettled at max samples" in sampler.describe(assessment)
+
+
+def test_min_and_max_samples_are_normalised():
+    sampler = SequentialSampler(min_samples=0, max_samples=1)
+    assert sampler.min_samples == 2
+    assert sampler.max_samples == 2
+
+
+def scripted_outcomes(monkeypatch, outcomes, client_ms=None):
+    """Replace run_scenario with a fixed sequence of outcomes"""
+    from harness import engine
+
+    sent = []
+    queue = list(outcomes)
+
+    def fake_run_scenario(scenario, url, timeout):
+        sent.append(scenario["payload"])
+        status, error, elapsed, passed = queue.pop(0)
+        outcome = {"name": scenario["name"], "mode": "sales-coach", "passed": passed,
+                   "details": "", "excerpt": None, "failed_checks": [] if passed else ["check"],
+                   "elapsed": elapsed, "status": status, "error": error}
+        if client_ms is not None:
+            outcome["client_ms"] = client_ms
+        return outcome
+
+    monkeypatch.setattr(engine, "run_scenario", fake_run_scenario)
+    return sent
+
+
+SCENARIO = {"name": "s", "payload": {"mode": "sales-coach", "sessionId": "legacy"}}
+
+
+def test_transport_errors_stay_out_of_pass_rate_and_latency(monkeypatch):
+    from harness.engine import sample_scenario
+
+    sent = scripted_outcomes(monkeypatch, [
+        (None, "network", 0, False),
+        (429, "http", 40, False),
+        (502, "http", 900, False)
+    ] + [(200, None, 12000, True)] * 10)
+    sampler = SequentialSampler(min_samples=3, max_samples=20)
+    result = sample_scenario(SCENARIO, "http://worker", 30, sampler)
+
+    sampling = result["sampling"]
+    assert result["passed"]
+    assert sampling["passes"] == sampling["samples"]
+    assert sampling["attempts"] == sampling["samples"] + 3
+    assert sampling["transport_errors"] == {"network": 1, "HTTP 429": 1, "HTTP 502": 1}
+    # Only the 12 s responses shape the p95 estimate
+    assert 11000 < sampling["p95_ms"][1] < 13000
+    assert "excluded:" in result["details"]
+    # Every attempt runs on its own worker session, legacy payloads included
+    assert len({p["session"] for p in sent}) == len(sent)
+
+
+def test_only_transport_errors_never_pass(monkeypatch):
+    from harness.engine import sample_scenario
+
+    scripted_outcomes(monkeypatch, [(429, "http", 30, False)] * 4)
+    sampler = SequentialSampler(min_samples=2, max_samples=4)
+    result = sample_scenario(SCENARIO, "http://worker", 30, sampler)
+
+    assert not result["passed"]
+    assert result["sampling"]["samples"] == 0
+    assert result["sampling"]["attempts"] == 4
+    assert result["sampling"]["exhausted"]
+
+
+def test_contract_rejections_still_count_against_the_pass_rate(monkeypatch):
+    from harness.engine import sample_scenario
+
+    scripted_outcomes(monkeypatch, [(400, "http", 30, False)] * 5)
+    result = sample_scenario(SCENARIO, "http://worker", 30, SequentialSampler(min_samples=3, max_samples=5))
+
+    assert result["sampling"]["samples"] == 5
+    assert result["sampling"]["transport_errors"] == {}
+    assert not result["passed"]
+
+
+def test_client_cpu_and_elapsed_cover_every_attempt(monkeypatch):
+    from harness.engine import sample_scenario
+
+    scripted_outcomes(monkeypatch, [(429, "http", 40, False)] + [(200, None, 1000, True)] * 3,
+                      client_ms=2.5)
+    result = sample_scenario(SCENARIO, "http://worker", 30, SequentialSampler(min_samples=2, max_samples=4))
+
+    assert result["sampling"]["attempts"] == 4
+    assert result["client_ms"] == 10.0
+    assert result["elapsed_total"] == 3040
@@ -0,0 +1,23 @@
+"""Contract checks on canned worker responses"""
+
+import pytest
+
+from harness.config import CANONICAL_METRICS
+from harness.scenarios import check_emotional_assessment, check_sales_coach
+
+
+def coach_response(metrics):
+    return {
+        "reply": "Challenge: stable patients. Rep Approach: ask who misses visits? "
+                 "Impact: adherence. Suggested Phrasing: which patient comes to mind first?",
+        "coach": {"scores": {m: 4 for m in metrics}}
+    }
+
+
+@pytest.mark.parametrize("check", [check_sales_coach, check_emotional_assessment])
+def test_every_canonical_metric_is_required(check):
+    complete, _, _ = check(coach_response(CANONICAL_METRICS), 100)
+    partial, _, _ = check(coach_response(CANONICAL_METRICS[:-1]), 100)
+
+    assert dict(complete)["All EI metrics present"]
+    assert not dict(partial)["All EI metrics present"]
@@ -0,0 +1,79 @@
+"""-k expression parsing and scenario selection"""
+
+import re
+
+import pytest
+
+from harness.selection import keywords, matches, select
+
+SALES_HIV = {
+    "name": "Sales Coach - HIV",
+    "suite": "deployment",
+    "category": "SALES COACH MODE",
+    "payload": {"mode": "sales-coach", "disease": "HIV", "persona": "Difficult HCP"}
+}
+ROLE_PLAY_ONC = {
+    "name": "Role Play - Engaged Physician",
+    "suite": "deployment",
+    "category": "ROLE PLAY MODE",
+    "payload": {"mode": "role-play", "disease": "Oncology", "persona": "Engaged Physician"}
+}
+EI_SCORING = {
+    "name": "EI Scoring - Emotional Assessment",
+    "suite": "ei-scoring",
+    "category": "EI SCORING",
+    "payload": {"mode": "emotional-assessment"}
+}
+CATALOGUE = [SALES_HIV, ROLE_PLAY_ONC, EI_SCORING]
+
+
+def test_keywords_cover_name_suite_category_and_payload_tags():
+    text = keywords(SALES_HIV)
+    for term in ("sales coach - hiv", "deployment", "sales coach mode", "sales-coach", "difficult hcp"):
+        assert term in text
+
+
+@pytest.mark.parametrize("expression", ["", "   ", None])
+def test_empty_expression_matches_everything(expression):
+    assert matches(expression, SALES_HIV)
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("hiv", True),
+    ("HIV", True),
+    ("oncology", False),
+    ("sales-coach and hiv", True),
+    ("sales-coach and oncology", False),
+    ("oncology or hiv", True),
+    ("not hiv", False),
+    ("not not hiv", True),
+    ("sales-coach and (oncology or hiv)", True),
+    ("(sales-coach and oncology) or role-play", False),
+    # and binds tighter than or
+    ("role-play and oncology or hiv", True),
+    ("role-play and (oncology or hiv)", False)
+])
+def test_boolean_operators_and_precedence(expression, expected):
+    assert matches(expression, SALES_HIV) is expected
+
+
+@pytest.mark.parametrize("expression, message", [
+    ("hiv and", "incomplete"),
+    ("not", "incomplete"),
+    ("(hiv", "missing ')'"),
+    ("hiv)", "unexpected ')'"),
+    ("and hiv", "unexpected 'and'"),
+    ("hiv or or oncology", "unexpected 'or'"),
+    ("hiv oncology", "unexpected 'oncology'"),
+    ("()", "unexpected ')'")
+])
+def test_malformed_expressions_raise_value_error(expression, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        matches(expression, SALES_HIV)
+
+
+def test_select_filters_by_suite_and_keeps_catalogue_order():
+    assert select(CATALOGUE, "", ["deployment"]) == [SALES_HIV, ROLE_PLAY_ONC]
+    assert select(CATALOGUE, "", ["ei-scoring"]) == [EI_SCORING]
+    assert select(CATALOGUE, "not hiv") == [ROLE_PLAY_ONC, EI_SCORING]
+    assert select(CATALOGUE, "assessment", ["deployment"]) == []